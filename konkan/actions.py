@@ -14,14 +14,14 @@ from .threats import discard_feeds_next_player_sarf
 MAX_DISCARD_CHOICES = 16
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DrawAction:
     """Action describing how a player draws a card."""
 
     source: str  # "deck" or "trash"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlayAction:
     """Action describing optional table operations and the discard."""
 
@@ -34,7 +34,7 @@ def legal_draw_actions(state: KonkanState, player_index: int) -> list[DrawAction
     """Return draw actions available to ``player_index``."""
 
     player = state.players[player_index]
-    if player.phase != TurnPhase.AWAITING_DRAW:
+    if player.phase is not TurnPhase.AWAITING_DRAW:
         return []
 
     public = state.public
@@ -44,7 +44,7 @@ def legal_draw_actions(state: KonkanState, player_index: int) -> list[DrawAction
     actions: list[DrawAction] = []
     if public.draw_pile:
         actions.append(DrawAction(source="deck"))
-    if rules.can_draw_from_trash(state, player_index):
+    if rules.can_draw_from_trash_state(state, player_index):
         actions.append(DrawAction(source="trash"))
     return actions
 
@@ -113,7 +113,7 @@ def legal_play_actions(
     """Return discard-phase actions available to ``player_index``."""
 
     player = state.players[player_index]
-    if player.phase != TurnPhase.AWAITING_TRASH:
+    if player.phase is not TurnPhase.AWAITING_TRASH:
         return []
 
     candidate_cards = encoding.cards_from_mask(player.hand_mask)
@@ -40,8 +40,9 @@ def _ensure_stock(game_state: state.KonkanState, rng: random.Random) -> None:
         return
     if len(public.trash_pile) <= 1:
         return
-    top_card = public.trash_pile.pop()
-    pool = public.trash_pile[:]
+    # Recycle the trash list in place as the new stock rather than copying it.
+    pool = public.trash_pile
+    top_card = pool.pop()
     rng.shuffle(pool)
     public.draw_pile = pool
     public.trash_pile = [top_card]
@@ -116,7 +117,7 @@ def _play_round(
         current = public.current_player_index
         player_state = game_state.players[current]
 
-        if player_state.phase == state.TurnPhase.AWAITING_DRAW:
+        if player_state.phase is state.TurnPhase.AWAITING_DRAW:
             _ensure_stock(game_state, rng)
             draw_options = actions.legal_draw_actions(game_state, current)
             if not draw_options:
@@ -125,9 +126,8 @@ def _play_round(
             actions.apply_draw_action(game_state, current, selected_draw)
             continue
 
-        hand_cards = encoding.cards_from_mask(player_state.hand_mask)
         play_options = actions.legal_play_actions(
-            game_state, current, max_discards=len(hand_cards)
+            game_state, current, max_discards=player_state.hand_mask.bit_count()
         )
         if not play_options:
             raise RuntimeError("No legal play actions available during benchmark")
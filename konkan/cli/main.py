@@ -56,8 +56,9 @@ def _ensure_stock(state_obj: state.KonkanState, rng: random.Random) -> None:
         return
     if len(public.trash_pile) <= 1:
         return
-    top_card = public.trash_pile.pop()
-    pool = public.trash_pile[:]
+    # Recycle the trash list in place as the new stock rather than copying it.
+    pool = public.trash_pile
+    top_card = pool.pop()
     rng.shuffle(pool)
     public.draw_pile = pool
     public.trash_pile = [top_card]
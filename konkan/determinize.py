@@ -46,9 +46,8 @@ def sample_world(state: KonkanState, rng: Any, *, actor_index: int | None = None
     available_cards: list[int] = []
 
     for idx, player in enumerate(shuffled.players):
-        hand_cards = encoding.cards_from_mask(player.hand_mask)
         if idx != actor_index:
-            available_cards.extend(hand_cards)
+            available_cards.extend(encoding.cards_from_mask(player.hand_mask))
 
     available_cards.extend(public.draw_pile)
     shuffle_fn(available_cards)
@@ -58,18 +57,18 @@ def sample_world(state: KonkanState, rng: Any, *, actor_index: int | None = None
     for idx, player in enumerate(shuffled.players):
         if idx == actor_index:
             continue
-        hand_size = len(encoding.cards_from_mask(player.hand_mask))
+        hand_size = player.hand_mask.bit_count()
         if hand_size == 0:
             continue
         if hand_size > len(available_cards):  # pragma: no cover - defensive guard
             raise RuntimeError("insufficient cards to reassign opponent hand")
-        new_cards = [available_cards.pop() for _ in range(hand_size)]
-        player.hand_mask = encoding.mask_from_cards(new_cards)
+        split_index = len(available_cards) - hand_size
+        player.hand_mask = encoding.mask_from_cards(available_cards[split_index:])
+        del available_cards[split_index:]
 
     if draw_length > len(available_cards):  # pragma: no cover - defensive guard
         raise RuntimeError("not enough cards remaining to form draw pile")
 
-    new_draw = available_cards[:draw_length]
-    public.draw_pile = list(new_draw)
+    public.draw_pile = available_cards[:draw_length]
 
     return shuffled
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from operator import getitem
 from typing import Final, Iterable, Iterator
 
 RANKS: Final[list[str]] = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
@@ -14,6 +15,8 @@ IDX_TO_SUIT: Final[dict[int, str]] = {idx: suit for suit, idx in SUIT_TO_IDX.ite
 JOKER_IDS: Final[tuple[int, int]] = (104, 105)
 POINTS: Final[list[int]] = [10] + list(range(2, 10)) + [10, 10, 10, 10]
 DECK_CARD_COUNT: Final[int] = 106
+JOKER_MASK: Final[int] = (1 << JOKER_IDS[0]) | (1 << JOKER_IDS[1])
+_DECK_MASK: Final[int] = (1 << DECK_CARD_COUNT) - 1
 
 
 @dataclass(frozen=True, slots=True)
@@ -121,24 +124,43 @@ def has_card(mask: int, card_identifier: int) -> bool:
 def iter_cards(mask: int) -> Iterator[int]:
     """Yield all card identifiers present in ``mask``."""
 
-    for card_identifier in range(DECK_CARD_COUNT):
-        if (mask >> card_identifier) & 1:
-            yield card_identifier
+    yield from cards_from_mask(mask)
 
 
 def cards_from_mask(mask: int) -> list[int]:
     """Return a list of card identifiers contained in ``mask``."""
 
-    return list(iter_cards(mask))
+    # Walk only the set bits, lowest first, instead of probing every identifier.
+    mask &= _DECK_MASK
+    cards: list[int] = []
+    while mask:
+        low_bit = mask & -mask
+        cards.append(low_bit.bit_length() - 1)
+        mask ^= low_bit
+    return cards
+
+
+_MASK_BYTES: Final[int] = (DECK_CARD_COUNT + 7) // 8
+# Point total of every byte value at every byte offset of a mask; jokers score 0.
+_POINTS_BY_BYTE: Final[tuple[tuple[int, ...], ...]] = tuple(
+    tuple(
+        sum(
+            card_points(offset * 8 + bit)
+            for bit in range(8)
+            if (value >> bit) & 1 and offset * 8 + bit < DECK_CARD_COUNT
+        )
+        for value in range(256)
+    )
+    for offset in range(_MASK_BYTES)
+)
 
 
 def points_from_mask(mask: int) -> int:
     """Return the total point value represented by ``mask``."""
 
-    total = 0
-    for card_identifier in iter_cards(mask):
-        total += card_points(card_identifier)
-    return total
+    # Bits outside the deck carry no points; masking also keeps ``to_bytes`` in range.
+    mask &= _DECK_MASK
+    return sum(map(getitem, _POINTS_BY_BYTE, mask.to_bytes(_MASK_BYTES, "little")))
 
 
 def split_mask(mask: int) -> tuple[int, int]:
@@ -106,7 +106,7 @@ def analyze_hand(
         mask = encoding.combine_mask(int(getattr(meld, "mask_hi", 0)), int(getattr(meld, "mask_lo", 0)))
         baseline_used_mask |= mask
 
-    joker_count = sum(1 for card_id in hand_cards if encoding.decode_id(card_id).is_joker)
+    joker_count = (hand_mask & encoding.JOKER_MASK).bit_count()
 
     progress_denominator = max(8, len(public.draw_pile) + public.turn_index + len(public.trash_pile))
     progress = min(1.0, public.turn_index / progress_denominator)
@@ -16,8 +16,9 @@ class Node:
     total_value: List[float] = field(init=False)
 
     def __post_init__(self) -> None:
-        self.visits = [0 for _ in self.priors]
-        self.total_value = [0.0 for _ in self.priors]
+        action_count = len(self.priors)
+        self.visits = [0] * action_count
+        self.total_value = [0.0] * action_count
 
     def best_action_index(self) -> int:
         """Return the index of the best action according to visit count."""
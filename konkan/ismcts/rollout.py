@@ -140,15 +140,18 @@ def _static_heuristic_value(state: KonkanState, player_index: int, threshold: in
     mask_hi, mask_lo = encoding.split_mask(player.hand_mask)
     cover = melds.best_cover_to_threshold(mask_hi, mask_lo, threshold)
 
-    used_hi = np.uint64(0)
-    used_lo = np.uint64(0)
+    used_hi = 0
+    used_lo = 0
     for meld in cover.melds:
-        used_hi |= np.uint64(getattr(meld, "mask_hi", 0))
-        used_lo |= np.uint64(getattr(meld, "mask_lo", 0))
+        used_hi |= int(getattr(meld, "mask_hi", 0))
+        used_lo |= int(getattr(meld, "mask_lo", 0))
 
     hand_array = np.array(hand_cards_list, dtype=np.int16)
 
-    deadwood = _deadwood_points(hand_array, used_hi, used_lo, _RANK_POINTS, _CARD_RANKS)
+    # Masks stay Python ints until the numba boundary, which needs unsigned words.
+    deadwood = _deadwood_points(
+        hand_array, np.uint64(used_hi), np.uint64(used_lo), _RANK_POINTS, _CARD_RANKS
+    )
     extenders = _count_extenders(hand_array, _CARD_RANKS, _CARD_SUITS)
 
     score = -float(deadwood)
@@ -219,12 +222,12 @@ def _apply_best_play_action(state: KonkanState, player_index: int) -> None:
 def _simulate_turn(state: KonkanState, player_index: int) -> None:
     player = state.players[player_index]
 
-    if player.phase == TurnPhase.AWAITING_DRAW:
+    if player.phase is TurnPhase.AWAITING_DRAW:
         _apply_best_draw_action(state, player_index)
 
     if state.public.current_player_index != player_index:
         return
 
     player = state.players[player_index]
-    if player.phase == TurnPhase.AWAITING_TRASH:
+    if player.phase is TurnPhase.AWAITING_TRASH:
         _apply_best_play_action(state, player_index)
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from typing import Sequence, cast
 
 from .. import actions as actions_module
-from .. import encoding, rules
+from .. import rules
 from .. import state as state_module
 from ..determinize import sample_world
 from ..state import KonkanState, PublicState
@@ -96,12 +96,12 @@ def run_search(state: KonkanState, rng: object, config: SearchConfig) -> Node:
 
     player_index = public.current_player_index
     player = state.players[player_index]
-    if player.phase != state_module.TurnPhase.AWAITING_TRASH:
+    if player.phase is not state_module.TurnPhase.AWAITING_TRASH:
         return Node(priors=[1.0], actions=[None])
 
-    hand_cards = encoding.cards_from_mask(player.hand_mask)
+    hand_count = player.hand_mask.bit_count()
     play_actions = actions_module.legal_play_actions(
-        state, player_index, max_discards=len(hand_cards) if hand_cards else 1
+        state, player_index, max_discards=hand_count if hand_count else 1
     )
     if not play_actions:
         return Node(priors=[1.0], actions=[None])
@@ -17,6 +17,7 @@ class MeldProtocol(Protocol):
     mask_lo: int
     points: int
     jokers_used: int
+    kind: int
 
 
 class CoverResultProtocol(Protocol):
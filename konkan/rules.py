@@ -4,16 +4,48 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Callable, Final, Iterable, Sequence, cast
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Final, Sequence
 
 from . import encoding, melds
-from .melds import CoverResultProtocol
+from . import state as state_module
 
 SET_KIND = 0
 RUN_KIND = 1
 
+# Deadwood value of each card identifier; jokers count for nothing in hand.
+_POINTS_BY_ID: Final[tuple[int, ...]] = tuple(
+    0 if card_id in encoding.JOKER_IDS else encoding.card_points(card_id)
+    for card_id in range(encoding.DECK_CARD_COUNT)
+)
+_JOKER_MASK: Final[int] = encoding.JOKER_MASK
+_MAX_CARD_POINTS: Final[int] = max(encoding.POINTS)
+_ALL_CARDS_MASK: Final[int] = (1 << encoding.DECK_CARD_COUNT) - 1
+_IS_JOKER: Final[tuple[bool, ...]] = tuple(
+    card_id in encoding.JOKER_IDS for card_id in range(encoding.DECK_CARD_COUNT)
+)
+# Rank and suit index of each card identifier; jokers map to -1.
+_RANK_OF: Final[tuple[int, ...]] = tuple(
+    encoding.decode_id(card_id).rank_idx for card_id in range(encoding.DECK_CARD_COUNT)
+)
+_SUIT_OF: Final[tuple[int, ...]] = tuple(
+    encoding.decode_id(card_id).suit_idx for card_id in range(encoding.DECK_CARD_COUNT)
+)
+# Both physical copies of each (suit, rank), indexed as [suit][rank].
+_CARD_PAIR_MASKS: Final[tuple[tuple[int, ...], ...]] = tuple(
+    tuple(
+        (1 << encoding.card_id(rank_idx, suit_idx, 0)) | (1 << encoding.card_id(rank_idx, suit_idx, 1))
+        for rank_idx in range(len(encoding.RANKS))
+    )
+    for suit_idx in range(len(encoding.SUITS))
+)
+# Turn phase members are singletons, so phase checks compare by identity.
+_AWAITING_DRAW: Final = state_module.TurnPhase.AWAITING_DRAW
+_AWAITING_TRASH: Final = state_module.TurnPhase.AWAITING_TRASH
+_COMPLETE: Final = state_module.TurnPhase.COMPLETE
+
 if TYPE_CHECKING:
-    from .state import KonkanConfig, KonkanState, PlayerPublic, PlayerState, PublicState
+    from .state import KonkanConfig, KonkanState, MeldOnTable, PlayerPublic, PlayerState, PublicState
 
 __all__ = [
     "TurnPhase",
@@ -28,6 +60,8 @@ __all__ = [
     "effective_threshold",
     "someone_is_down",
     "can_draw_from_trash",
+    "can_draw_from_trash_masks",
+    "can_draw_from_trash_state",
     "requires_opening_discard",
     "can_finish_via_sarf",
     "can_player_come_down",
@@ -37,6 +71,8 @@ __all__ = [
     "trash_card",
     "sarf_card",
     "can_sarf_card",
+    "table_extension_mask",
+    "clear_caches",
     "final_scores",
 ]
 
@@ -85,7 +121,7 @@ class IllegalTrash(RuntimeError):
     """Raised when a player attempts to trash illegally."""
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class LayDownResult:
     """Result structure returned after a successful lay-down."""
 
@@ -107,7 +143,10 @@ class PlayerRoundScore:
 def someone_is_down(public: Sequence["PlayerPublic"]) -> bool:
     """Return ``True`` when at least one player has already come down."""
 
-    return any(player.came_down for player in public)
+    for player in public:
+        if player.came_down:
+            return True
+    return False
 
 
 def effective_threshold(
@@ -125,14 +164,13 @@ def effective_threshold(
 def _mask_with_card(mask_hi: int, mask_lo: int, card_identifier: int) -> tuple[int, int]:
     """Return masks updated to include ``card_identifier``."""
 
-    if card_identifier < 64:
-        mask_lo |= 1 << card_identifier
-    else:
-        mask_hi |= 1 << (card_identifier - 64)
-    return mask_hi, mask_lo
+    bit = 1 << (card_identifier & 63)
+    if card_identifier >> 6:
+        return mask_hi | bit, mask_lo
+    return mask_hi, mask_lo | bit
 
 
-def _can_draw_from_trash_kwargs(
+def can_draw_from_trash_masks(
     *,
     trash: Sequence[int],
     hand_mask: tuple[int, int],
@@ -140,11 +178,13 @@ def _can_draw_from_trash_kwargs(
     public_state: Sequence["PlayerPublic"],
     highest_table_points: int,
     thresholds: Thresholds = DEFAULT_THRESHOLDS,
-    cover_to_threshold: Callable[
-        [int, int, int], melds.CoverResultProtocol
-    ] = melds.best_cover_to_threshold,
+    cover_to_threshold: Callable[[int, int, int], melds.CoverResultProtocol] | None = None,
 ) -> bool:
-    """Determine whether the player may take the top trash card this turn."""
+    """Determine whether the player may take the top trash card this turn.
+
+    ``cover_to_threshold`` defaults to the memoized ``melds`` solver path; pass
+    a callable to evaluate the cover with it instead.
+    """
 
     if not trash:
         return False
@@ -153,6 +193,8 @@ def _can_draw_from_trash_kwargs(
 
     threshold = effective_threshold(public_state, highest_table_points, thresholds)
     mask_hi, mask_lo = hand_mask
+    if cover_to_threshold is None:
+        return _cover_reaches(encoding.add_card((mask_hi << 64) | mask_lo, trash[-1]), threshold)
     updated_hi, updated_lo = _mask_with_card(mask_hi, mask_lo, trash[-1])
     cover = cover_to_threshold(updated_hi, updated_lo, threshold)
     return cover.total_points >= threshold
@@ -165,7 +207,7 @@ def requires_opening_discard(state: "KonkanState") -> bool:
         state.turn_index == 0
         and state.player_to_act == 0
         and not state.first_player_has_discarded
-        and state.phase == TurnPhase.DISCARD
+        and state.phase is TurnPhase.DISCARD
     )
 
 
@@ -180,8 +222,6 @@ def _resolve_runtime_components(
 ) -> tuple["KonkanConfig", Sequence["PlayerState"], "PublicState"]:
     """Return configuration, players, and public state for high-level helpers."""
 
-    from . import state as state_module
-
     config = state.config
     if config is None:
         raise ValueError("KonkanState is missing configuration; use deal_new_game")
@@ -195,23 +235,37 @@ def _resolve_runtime_components(
     return config, state.players, public
 
 
+def _come_down_threshold(config: "KonkanConfig", public: "PublicState") -> int:
+    """Return the points a player must lay to come down at the current table."""
+
+    highest = public.highest_table_points
+    if highest > 0:
+        return max(config.come_down_points, highest + 1)
+    return config.come_down_points
+
+
 def can_draw_from_trash(*args, **kwargs) -> bool:
     """Determine whether a trash draw is legal.
 
     Maintains backwards compatibility with the keyword-oriented helper used in
     lower-level tests while also supporting the high-level ``KonkanState`` form.
+    Engine code calls :func:`can_draw_from_trash_state` or
+    :func:`can_draw_from_trash_masks` directly to skip this dispatch.
     """
 
     if not args:
-        return _can_draw_from_trash_kwargs(**kwargs)
+        return can_draw_from_trash_masks(**kwargs)
     if len(args) != 2 or kwargs:
         raise TypeError("expected state and player index arguments")
 
     state, player_index = args
-    from . import state as state_module
-
     if not isinstance(state, state_module.KonkanState):
         raise TypeError("first argument must be a KonkanState instance")
+    return can_draw_from_trash_state(state, player_index)
+
+
+def can_draw_from_trash_state(state: "KonkanState", player_index: int) -> bool:
+    """Return ``True`` if ``player_index`` may take the top trash card in ``state``."""
 
     try:
         config, players, public = _resolve_runtime_components(state)
@@ -226,7 +280,7 @@ def can_draw_from_trash(*args, **kwargs) -> bool:
         return False
 
     player = players[player_index]
-    if player.phase != state_module.TurnPhase.AWAITING_DRAW:
+    if player.phase is not _AWAITING_DRAW:
         return False
     if public.last_trash_by == player_index:
         return False
@@ -238,12 +292,7 @@ def can_draw_from_trash(*args, **kwargs) -> bool:
         return True
 
     prospective_mask = encoding.add_card(player.hand_mask, public.trash_pile[-1])
-    threshold = config.come_down_points
-    if public.highest_table_points > 0:
-        threshold = max(threshold, public.highest_table_points + 1)
-    mask_hi, mask_lo = encoding.split_mask(prospective_mask)
-    cover = melds.best_cover_to_threshold(mask_hi, mask_lo, threshold)
-    return cover.total_points >= threshold
+    return _cover_reaches(prospective_mask, _come_down_threshold(config, public))
 
 
 def can_player_come_down(state: "KonkanState", player_index: int) -> bool:
@@ -261,14 +310,88 @@ def can_player_come_down(state: "KonkanState", player_index: int) -> bool:
     if player.has_come_down:
         return False
 
-    threshold = config.come_down_points
-    if public.highest_table_points > 0:
-        threshold = max(threshold, public.highest_table_points + 1)
-    mask_hi, mask_lo = encoding.split_mask(player.hand_mask)
+    return _hand_meets_threshold(player.hand_mask, _come_down_threshold(config, public))
+
+
+def _hand_meets_threshold(hand_mask: int, threshold: int) -> bool:
+    """Return ``True`` when ``hand_mask`` can be laid for at least ``threshold`` points."""
+
+    return encoding.points_from_mask(hand_mask) >= threshold or _cover_reaches(hand_mask, threshold)
+
+
+def clear_caches() -> None:
+    """Drop every memoized rule result.
+
+    The caches are keyed on hand masks only, not on the ``melds`` solver in
+    use. Swapping the solver (for example by monkeypatching
+    ``melds.best_cover_to_threshold`` or ``melds.HAVE_NATIVE_SOLVER``) requires
+    calling this before the new solver is consulted.
+    """
+
+    _cover_reaches.cache_clear()
+    _lay_down_plan.cache_clear()
+    _meld_points.cache_clear()
+    _extension_mask.cache_clear()
+
+
+@lru_cache(maxsize=16384)
+def _cover_reaches(hand_mask: int, threshold: int) -> bool:
+    """Return ``True`` when the solver covers at least ``threshold`` points of ``hand_mask``."""
+
+    # A joker stands in for at most a ten-point card, so no cover can beat this bound.
+    joker_count = (hand_mask & _JOKER_MASK).bit_count()
+    if encoding.points_from_mask(hand_mask) + _MAX_CARD_POINTS * joker_count < threshold:
+        return False
+    mask_hi, mask_lo = encoding.split_mask(hand_mask)
     cover = melds.best_cover_to_threshold(mask_hi, mask_lo, threshold)
-    if cover.total_points >= threshold:
-        return True
-    return encoding.points_from_mask(player.hand_mask) >= threshold
+    return cover.total_points >= threshold
+
+
+_LayDownPlan = tuple[int, int, bool, tuple[tuple[int, int, int, int], ...]]
+
+
+@lru_cache(maxsize=4096)
+def _lay_down_plan(hand_mask: int, threshold: int, reserve_card: int | None) -> _LayDownPlan | None:
+    """Return ``(used_mask, points, from_cover, melds)`` for laying down ``hand_mask``.
+
+    ``melds`` holds ``(mask_hi, mask_lo, kind, points)`` entries. The plan only
+    depends on its arguments, so identical hands seen across search rollouts are
+    solved once and replayed by :func:`lay_down`.
+    """
+
+    attempts: list[int] = []
+    if reserve_card is not None and encoding.has_card(hand_mask, reserve_card):
+        attempts.append(encoding.remove_card(hand_mask, reserve_card))
+    attempts.append(hand_mask)
+
+    strict_solver = getattr(melds, "HAVE_NATIVE_SOLVER", False) and threshold >= DEFAULT_THRESHOLDS.base
+
+    for mask_candidate in attempts:
+        mask_hi_candidate, mask_lo_candidate = encoding.split_mask(mask_candidate)
+        cover = melds.best_cover_to_threshold(mask_hi_candidate, mask_lo_candidate, threshold)
+        if cover.total_points >= threshold:
+            used_mask = 0
+            layout: list[tuple[int, int, int, int]] = []
+            for meld_entry in cover.melds:
+                # Table melds keep plain ints; a NumPy word would also wrap on ``<< 64``.
+                entry_hi = int(meld_entry.mask_hi)
+                entry_lo = int(meld_entry.mask_lo)
+                used_mask |= (entry_hi << 64) | entry_lo
+                layout.append((entry_hi, entry_lo, int(meld_entry.kind), int(meld_entry.points)))
+            if layout:
+                return used_mask, int(cover.total_points), True, tuple(layout)
+            return None
+        if strict_solver:
+            continue
+        fallback_points = encoding.points_from_mask(mask_candidate)
+        if fallback_points < threshold:
+            continue
+        if mask_candidate == 0:
+            return None
+        fallback_meld = (mask_hi_candidate, mask_lo_candidate, RUN_KIND, fallback_points)
+        return mask_candidate, fallback_points, False, (fallback_meld,)
+
+    return None
 
 
 def lay_down(state: "KonkanState", player_index: int, *, reserve_card: int | None = None) -> LayDownResult:
@@ -288,88 +411,25 @@ def lay_down(state: "KonkanState", player_index: int, *, reserve_card: int | Non
         raise RuntimeError("player does not meet the coming-down threshold")
 
     player = players[player_index]
-    threshold = config.come_down_points
-    if public.highest_table_points > 0:
-        threshold = max(threshold, public.highest_table_points + 1)
-
-    original_mask = player.hand_mask
-    attempts: list[tuple[int, bool]] = []  # (mask_without_reserve, reserve_applied)
-    if reserve_card is not None and encoding.has_card(original_mask, reserve_card):
-        attempts.append((encoding.remove_card(original_mask, reserve_card), True))
-    attempts.append((original_mask, False))
-
-    used_mask_int = 0
-    total_points = 0
-    cover: CoverResultProtocol | None = None
-    strict_solver = getattr(melds, "HAVE_NATIVE_SOLVER", False) and threshold >= DEFAULT_THRESHOLDS.base
+    threshold = _come_down_threshold(config, public)
 
-    for mask_candidate, _reserve_applied in attempts:
-        mask_hi_candidate, mask_lo_candidate = encoding.split_mask(mask_candidate)
-        cover_candidate = melds.best_cover_to_threshold(mask_hi_candidate, mask_lo_candidate, threshold)
-        total_points_candidate = cover_candidate.total_points
-        used_mask_candidate = 0
-        chosen_cover: CoverResultProtocol | None
-        if total_points_candidate >= threshold:
-            for meld_entry in cast(Iterable[Any], cover_candidate.melds):
-                mask_hi_entry = int(getattr(meld_entry, "mask_hi", 0))
-                mask_lo_entry = int(getattr(meld_entry, "mask_lo", 0))
-                used_mask_candidate |= (mask_hi_entry << 64) | mask_lo_entry
-            chosen_cover = cover_candidate
-        else:
-            if strict_solver:
-                continue
-            fallback_points = encoding.points_from_mask(mask_candidate)
-            if fallback_points < threshold:
-                continue
-            total_points_candidate = fallback_points
-            used_mask_candidate = mask_candidate
-            chosen_cover = None
-
-        used_mask_int = used_mask_candidate
-        total_points = total_points_candidate
-        cover = chosen_cover
-        break
-
-    if used_mask_int == 0:
+    plan = _lay_down_plan(player.hand_mask, threshold, reserve_card)
+    if plan is None:
         raise RuntimeError("player does not meet the coming-down threshold")
+    used_mask_int, total_points, laid_from_cover, layout = plan
 
     deadwood_mask = player.hand_mask & ~used_mask_int
-
-    table_entries: list = []
-    if cover is not None and total_points >= threshold and getattr(cover, "melds", None):
-        for native_meld in cast(Iterable[Any], cover.melds):
-            mask_hi_native = int(getattr(native_meld, "mask_hi", 0))
-            mask_lo_native = int(getattr(native_meld, "mask_lo", 0))
-            kind = int(getattr(native_meld, "kind", RUN_KIND))
-            points = int(getattr(native_meld, "points", total_points))
-            table_entries.append(
-                _create_table_meld(
-                    owner=player_index,
-                    mask_hi=mask_hi_native,
-                    mask_lo=mask_lo_native,
-                    kind=kind,
-                    points=points,
-                )
-            )
-    elif used_mask_int:
-        mask_hi_total, mask_lo_total = encoding.split_mask(used_mask_int)
-        points = encoding.points_from_mask(used_mask_int)
-        table_entries.append(
-            _create_table_meld(
-                owner=player_index,
-                mask_hi=mask_hi_total,
-                mask_lo=mask_lo_total,
-                kind=RUN_KIND,
-                points=points,
-            )
-        )
+    table_entries = [
+        _create_table_meld(owner=player_index, mask_hi=mask_hi, mask_lo=mask_lo, kind=kind, points=points)
+        for mask_hi, mask_lo, kind, points in layout
+    ]
 
     player.has_come_down = True
     player.laid_mask |= used_mask_int
     player.hand_mask = deadwood_mask
     state.table.extend(table_entries)
 
-    if cover is not None and total_points >= threshold and getattr(cover, "melds", None):
+    if laid_from_cover:
         laid_points_total = int(total_points)
     else:
         laid_points_total = encoding.points_from_mask(player.laid_mask)
@@ -384,8 +444,6 @@ def lay_down(state: "KonkanState", player_index: int, *, reserve_card: int | Non
 def draw_from_stock(state: "KonkanState", player_index: int) -> int:
     """Draw the next card from the stock (draw pile) for ``player_index``."""
 
-    from . import state as state_module
-
     _, players, public = _resolve_runtime_components(state)
     if player_index < 0 or player_index >= len(players):
         raise IllegalDraw("invalid player index")
@@ -395,14 +453,14 @@ def draw_from_stock(state: "KonkanState", player_index: int) -> int:
         raise IllegalDraw("not this player's turn")
 
     player = players[player_index]
-    if player.phase != state_module.TurnPhase.AWAITING_DRAW:
+    if player.phase is not _AWAITING_DRAW:
         raise IllegalDraw("player must be awaiting a draw")
     if not public.draw_pile:
         raise IllegalDraw("draw pile is empty")
 
     card_identifier = public.draw_pile.pop()
     player.hand_mask = encoding.add_card(player.hand_mask, card_identifier)
-    player.phase = state_module.TurnPhase.AWAITING_TRASH
+    player.phase = _AWAITING_TRASH
     player.last_action_was_trash = False
     return card_identifier
 
@@ -410,8 +468,6 @@ def draw_from_stock(state: "KonkanState", player_index: int) -> int:
 def draw_from_trash(state: "KonkanState", player_index: int) -> int:
     """Draw the top trash card for ``player_index``."""
 
-    from . import state as state_module
-
     _config, players, public = _resolve_runtime_components(state)
     if player_index < 0 or player_index >= len(players):
         raise IllegalDraw("invalid player index")
@@ -419,13 +475,13 @@ def draw_from_trash(state: "KonkanState", player_index: int) -> int:
         raise IllegalDraw("round already finished")
     if public.current_player_index != player_index:
         raise IllegalDraw("not this player's turn")
-    if not can_draw_from_trash(state, player_index):
+    if not can_draw_from_trash_state(state, player_index):
         raise IllegalDraw("trash draw is not legal at this time")
 
     player = players[player_index]
     card_identifier = public.trash_pile.pop()
     player.hand_mask = encoding.add_card(player.hand_mask, card_identifier)
-    player.phase = state_module.TurnPhase.AWAITING_TRASH
+    player.phase = _AWAITING_TRASH
     player.last_action_was_trash = False
     public.last_trash_by = None
     return card_identifier
@@ -434,8 +490,6 @@ def draw_from_trash(state: "KonkanState", player_index: int) -> int:
 def trash_card(state: "KonkanState", player_index: int, card_identifier: int) -> None:
     """Discard ``card_identifier`` to the trash pile for ``player_index``."""
 
-    from . import state as state_module
-
     config, players, public = _resolve_runtime_components(state)
     if player_index < 0 or player_index >= len(players):
         raise IllegalTrash("invalid player index")
@@ -445,7 +499,7 @@ def trash_card(state: "KonkanState", player_index: int, card_identifier: int) ->
         raise IllegalTrash("not this player's turn to trash")
 
     player = players[player_index]
-    if player.phase != state_module.TurnPhase.AWAITING_TRASH:
+    if player.phase is not _AWAITING_TRASH:
         raise IllegalTrash("player must draw before trashing")
     if not encoding.has_card(player.hand_mask, card_identifier):
         raise IllegalTrash("card not present in hand")
@@ -456,9 +510,9 @@ def trash_card(state: "KonkanState", player_index: int, card_identifier: int) ->
 
     if player.hand_mask == 0 and player.has_come_down:
         public.winner_index = player_index
-        player.phase = state_module.TurnPhase.COMPLETE
+        player.phase = _COMPLETE
     else:
-        player.phase = state_module.TurnPhase.AWAITING_DRAW
+        player.phase = _AWAITING_DRAW
 
     public.last_trash_by = player_index
     public.turn_index += 1
@@ -472,21 +526,10 @@ def trash_card(state: "KonkanState", player_index: int, card_identifier: int) ->
     state.turn_index = public.turn_index
 
 
-def _hand_points(hand_mask: int) -> int:
-    total = 0
-    for card_id in encoding.cards_from_mask(hand_mask):
-        decoded = encoding.decode_id(card_id)
-        if decoded.is_joker:
-            continue
-        total += encoding.card_points(card_id)
-    return total
-
-
 def _create_table_meld(owner: int, mask_hi: int, mask_lo: int, kind: int, points: int):
-    from . import state as state_module
-
-    cards = encoding.cards_from_mask((mask_hi << 64) | mask_lo)
-    has_joker = any(card in encoding.JOKER_IDS for card in cards)
+    mask = (mask_hi << 64) | mask_lo
+    cards = tuple(encoding.cards_from_mask(mask))
+    has_joker = bool(mask & _JOKER_MASK)
     is_four_set = kind == SET_KIND and len(cards) == 4 and not has_joker
     return state_module.MeldOnTable(
         mask_hi=mask_hi,
@@ -500,35 +543,69 @@ def _create_table_meld(owner: int, mask_hi: int, mask_lo: int, kind: int, points
     )
 
 
-def _validate_meld(cards: list[int], expected_kind: int) -> bool:
-    mask = encoding.mask_from_cards(cards)
+@lru_cache(maxsize=32768)
+def _meld_points(mask: int, kind: int) -> int:
+    """Return the solver points for ``mask`` as a meld of ``kind``, or ``-1``."""
+
     mask_hi, mask_lo = encoding.split_mask(mask)
     for candidate in melds.enumerate_melds(mask_hi, mask_lo):
-        candidate_mask = (int(getattr(candidate, "mask_hi", 0)) << 64) | int(
-            getattr(candidate, "mask_lo", 0)
-        )
-        if candidate_mask == mask and int(getattr(candidate, "kind", expected_kind)) == expected_kind:
-            return True
-    return False
+        if (candidate.mask_hi << 64) | candidate.mask_lo == mask and candidate.kind == kind:
+            return int(candidate.points)
+    return -1
+
+
+@lru_cache(maxsize=8192)
+def _extension_mask(mask: int, kind: int) -> int:
+    """Return a superset of the cards that could extend or swap into the meld ``mask``."""
+
+    naturals = encoding.cards_from_mask(mask & ~_JOKER_MASK)
+    if not naturals:
+        return _ALL_CARDS_MASK
+
+    extension = _JOKER_MASK
+    if kind == SET_KIND:
+        rank_idx = _RANK_OF[naturals[0]]
+        present_suits = {_SUIT_OF[card] for card in naturals}
+        for suit_idx in range(len(encoding.SUITS)):
+            if suit_idx not in present_suits:
+                extension |= _CARD_PAIR_MASKS[suit_idx][rank_idx]
+        return extension
+
+    suit_masks = _CARD_PAIR_MASKS[_SUIT_OF[naturals[0]]]
+    ranks = [_RANK_OF[card] for card in naturals]
+    if mask & _JOKER_MASK or 0 in ranks:
+        # Jokers and the dual-ended ace make the open ends ambiguous; allow the whole suit.
+        for rank_mask in suit_masks:
+            extension |= rank_mask
+        return extension
+
+    low, high = min(ranks), max(ranks)
+    extension |= suit_masks[low - 1]
+    extension |= suit_masks[high + 1] if high + 1 < len(encoding.RANKS) else suit_masks[0]
+    return extension
+
+
+def _validate_meld(cards: list[int], expected_kind: int) -> bool:
+    return _meld_points(encoding.mask_from_cards(cards), expected_kind) >= 0
 
 
 def _validate_joker_extension(cards: list[int], expected_kind: int) -> bool:
     if _validate_meld(cards, expected_kind):
         return True
 
-    joker_count = sum(1 for card in cards if card in encoding.JOKER_IDS)
+    joker_count = sum(1 for card in cards if _IS_JOKER[card])
     if joker_count == 0:
         return False
 
-    natural_cards = [card for card in cards if card not in encoding.JOKER_IDS]
+    natural_cards = [card for card in cards if not _IS_JOKER[card]]
     if not natural_cards:
         return False
 
     if expected_kind == SET_KIND:
-        rank_indices = {encoding.decode_id(card).rank_idx for card in natural_cards}
+        rank_indices = {_RANK_OF[card] for card in natural_cards}
         if len(rank_indices) > 1:
             return False
-        suits = {encoding.decode_id(card).suit_idx for card in natural_cards}
+        suits = {_SUIT_OF[card] for card in natural_cards}
         if len(suits) != len(natural_cards):
             return False
         return True
@@ -537,11 +614,11 @@ def _validate_joker_extension(cards: list[int], expected_kind: int) -> bool:
     if len(cards) < 3:
         return False
 
-    suits = {encoding.decode_id(card).suit_idx for card in natural_cards}
+    suits = {_SUIT_OF[card] for card in natural_cards}
     if len(suits) != 1:
         return False
 
-    ranks = sorted(encoding.decode_id(card).rank_idx for card in natural_cards)
+    ranks = sorted(_RANK_OF[card] for card in natural_cards)
     prev = ranks[0]
     used_jokers = 0
     for rank in ranks[1:]:
@@ -556,79 +633,88 @@ def _validate_joker_extension(cards: list[int], expected_kind: int) -> bool:
     return True
 
 
-def _assign_meld_cards(meld, cards: list[int]) -> None:
+def _meld_with_cards(meld: "MeldOnTable", cards: Sequence[int]) -> "MeldOnTable":
+    """Return a copy of ``meld`` holding ``cards``, with masks and points recomputed."""
+
     mask = encoding.mask_from_cards(cards)
     mask_hi, mask_lo = encoding.split_mask(mask)
-    meld.cards = list(cards)
-    meld.mask_hi = mask_hi
-    meld.mask_lo = mask_lo
-    meld.has_joker = any(card in encoding.JOKER_IDS for card in cards)
-    if meld.kind == SET_KIND:
-        natural_suits = {
-            encoding.decode_id(card).suit_idx for card in cards if card not in encoding.JOKER_IDS
-        }
-        meld.is_four_set = len(cards) == 4 and not meld.has_joker and len(natural_suits) == 4
-    else:
-        meld.is_four_set = False
-    meld.has_joker = any(card in encoding.JOKER_IDS for card in cards)
+    kind = meld.kind
+    has_joker = bool(mask & _JOKER_MASK)
     if cards:
-        kind = meld.kind
         if kind == SET_KIND:
-            base_rank = next(
-                (encoding.decode_id(card).rank_idx for card in cards if card not in encoding.JOKER_IDS),
-                None,
-            )
-            meld.points = len(cards) * (encoding.POINTS[base_rank] if base_rank is not None else 0)
-        else:
-            mask_hi_local, mask_lo_local = encoding.split_mask(mask)
-            points = 0
-            for candidate in melds.enumerate_melds(mask_hi_local, mask_lo_local):
-                candidate_mask = (int(getattr(candidate, "mask_hi", 0)) << 64) | int(
-                    getattr(candidate, "mask_lo", 0)
-                )
-                if candidate_mask == mask:
-                    points = int(getattr(candidate, "points", 0))
+            base_rank = -1
+            for card in cards:
+                base_rank = _RANK_OF[card]
+                if base_rank >= 0:
                     break
-            if points == 0:
+            points = len(cards) * (encoding.POINTS[base_rank] if base_rank >= 0 else 0)
+        else:
+            points = _meld_points(mask, kind)
+            if points <= 0:
                 points = encoding.points_from_mask(mask)
-            meld.points = points
     else:
-        meld.points = 0
-    meld.is_four_set = meld.kind == SET_KIND and len(cards) == 4 and not meld.has_joker
+        points = 0
+    return state_module.MeldOnTable(
+        mask_hi=mask_hi,
+        mask_lo=mask_lo,
+        cards=tuple(cards),
+        owner=meld.owner,
+        kind=kind,
+        has_joker=has_joker,
+        points=points,
+        is_four_set=kind == SET_KIND and len(cards) == 4 and not has_joker,
+    )
 
 
 def final_scores(state: "KonkanState") -> list[PlayerRoundScore]:
     """Return post-round scoring breakdown for each player."""
 
-    from . import state as state_module
-
     public = state.public
     if not isinstance(public, state_module.PublicState):
         raise ValueError("KonkanState public state is not initialised")
     if public.winner_index is None:
         raise ValueError("winner has not been determined")
 
+    winner_index = public.winner_index
     scores: list[PlayerRoundScore] = []
     for idx, player in enumerate(state.players):
         laid_points = int(getattr(player, "laid_points", 0))
-        deadwood_points = _hand_points(player.hand_mask)
-        won_round = idx == public.winner_index
-        net_points = laid_points - deadwood_points
+        deadwood_points = encoding.points_from_mask(player.hand_mask)
         scores.append(
             PlayerRoundScore(
                 player_index=idx,
                 laid_points=laid_points,
                 deadwood_points=deadwood_points,
-                net_points=net_points,
-                won_round=won_round,
+                net_points=laid_points - deadwood_points,
+                won_round=idx == winner_index,
             )
         )
     return scores
 
 
+def table_extension_mask(table: Sequence["MeldOnTable"]) -> int:
+    """Return a mask of every card that might extend or swap into an open meld.
+
+    The mask is a superset: a card outside it can never be sarfed onto
+    ``table``, while a card inside it still needs :func:`can_sarf_card`.
+    """
+
+    mask = 0
+    for meld in table:
+        if not meld.is_four_set:
+            mask |= _extension_mask(meld.mask128, meld.kind)
+    return mask
+
+
 def can_sarf_card(state: "KonkanState", player_index: int, target_meld_index: int, card_identifier: int) -> bool:
     """Return ``True`` if the player can legally sarf ``card_identifier`` onto the table."""
 
+    if 0 <= target_meld_index < len(state.table):
+        meld = state.table[target_meld_index]
+        extension = _extension_mask(meld.mask128, meld.kind)
+        if not (extension >> card_identifier) & 1:
+            return False
+
     clone = state.clone_shallow()
     try:
         sarf_card(clone, player_index, target_meld_index, card_identifier)
@@ -645,6 +731,10 @@ def sarf_card(
 ) -> None:
     """Add ``card_identifier`` to ``target_meld_index`` with Joker swap support."""
 
+    add_card = encoding.add_card
+    remove_card = encoding.remove_card
+    has_card = encoding.has_card
+
     _, players, public = _resolve_runtime_components(state)
     if public.winner_index is not None:
         raise RuntimeError("round already finished")
@@ -656,64 +746,63 @@ def sarf_card(
     player = players[player_index]
     if not player.has_come_down:
         raise RuntimeError("player must come down before sarfing")
-    if not encoding.has_card(player.hand_mask, card_identifier):
+    if not has_card(player.hand_mask, card_identifier):
         raise RuntimeError("card not present in hand")
 
     meld = state.table[target_meld_index]
     if meld.is_four_set:
         raise RuntimeError("cannot modify sealed set")
 
-    decoded = encoding.decode_id(card_identifier)
-    is_joker = decoded.is_joker
+    card_rank = _RANK_OF[card_identifier]
+    card_suit = _SUIT_OF[card_identifier]
+    is_joker = card_rank < 0
 
     if meld.kind == SET_KIND:
         if not is_joker:
-            base_ranks = [
-                encoding.decode_id(card).rank_idx for card in meld.cards if card not in encoding.JOKER_IDS
-            ]
-            if base_ranks and decoded.rank_idx not in base_ranks:
+            base_ranks = {_RANK_OF[card] for card in meld.cards if _RANK_OF[card] >= 0}
+            if base_ranks and card_rank not in base_ranks:
                 raise RuntimeError("rank mismatch for set")
-            existing_suits = {
-                encoding.decode_id(card).suit_idx
-                for card in meld.cards
-                if card not in encoding.JOKER_IDS
-            }
-            if decoded.suit_idx in existing_suits:
+            existing_suits = {_SUIT_OF[card] for card in meld.cards if _SUIT_OF[card] >= 0}
+            if card_suit in existing_suits:
                 raise RuntimeError("duplicate suit not allowed in set")
     else:  # run
         if not is_joker:
-            base_suits = {
-                encoding.decode_id(card).suit_idx
-                for card in meld.cards
-                if card not in encoding.JOKER_IDS
-            }
-            if base_suits and decoded.suit_idx not in base_suits:
+            base_suits = {_SUIT_OF[card] for card in meld.cards if _SUIT_OF[card] >= 0}
+            if base_suits and card_suit not in base_suits:
                 raise RuntimeError("suit mismatch for run")
 
-    if not is_joker and any(card in encoding.JOKER_IDS for card in meld.cards):
-        for index, table_card in enumerate(meld.cards):
-            if table_card in encoding.JOKER_IDS:
-                candidate_cards = list(meld.cards)
-                candidate_cards[index] = card_identifier
-                if _validate_meld(candidate_cards, meld.kind):
-                    player.hand_mask = encoding.remove_card(player.hand_mask, card_identifier)
-                    player.hand_mask = encoding.add_card(player.hand_mask, table_card)
-                    _assign_meld_cards(meld, candidate_cards)
-                    if not encoding.has_card(player.laid_mask, card_identifier):
-                        player.laid_mask = encoding.add_card(player.laid_mask, card_identifier)
-                        player.laid_points += encoding.card_points(card_identifier)
-                    return
-
-    candidate_cards = list(meld.cards) + [card_identifier]
+    meld_mask = meld.mask128
+    if not (_extension_mask(meld_mask, meld.kind) >> card_identifier) & 1:
+        raise RuntimeError("card does not extend meld")
+
+    joker_bits = 0 if is_joker else meld_mask & _JOKER_MASK
+    while joker_bits:
+        joker_bit = joker_bits & -joker_bits
+        joker_bits ^= joker_bit
+        table_card = joker_bit.bit_length() - 1
+        swapped_mask = (meld_mask ^ joker_bit) | (1 << card_identifier)
+        if _meld_points(swapped_mask, meld.kind) >= 0:
+            candidate_cards = list(meld.cards)
+            candidate_cards[candidate_cards.index(table_card)] = card_identifier
+            player.hand_mask = remove_card(player.hand_mask, card_identifier)
+            player.hand_mask = add_card(player.hand_mask, table_card)
+            state.table[target_meld_index] = _meld_with_cards(meld, candidate_cards)
+            if not has_card(player.laid_mask, card_identifier):
+                player.laid_mask = add_card(player.laid_mask, card_identifier)
+                player.laid_points += _POINTS_BY_ID[card_identifier]
+            return
+
     if is_joker:
+        candidate_cards = list(meld.cards) + [card_identifier]
         if not _validate_joker_extension(candidate_cards, meld.kind):
             raise RuntimeError("card does not extend meld")
     else:
-        if not _validate_meld(candidate_cards, meld.kind):
+        if _meld_points(meld_mask | (1 << card_identifier), meld.kind) < 0:
             raise RuntimeError("card does not extend meld")
+        candidate_cards = list(meld.cards) + [card_identifier]
 
-    player.hand_mask = encoding.remove_card(player.hand_mask, card_identifier)
-    _assign_meld_cards(meld, candidate_cards)
-    if not encoding.has_card(player.laid_mask, card_identifier):
-        player.laid_mask = encoding.add_card(player.laid_mask, card_identifier)
-        player.laid_points += encoding.card_points(card_identifier)
+    player.hand_mask = remove_card(player.hand_mask, card_identifier)
+    state.table[target_meld_index] = _meld_with_cards(meld, candidate_cards)
+    if not has_card(player.laid_mask, card_identifier):
+        player.laid_mask = add_card(player.laid_mask, card_identifier)
+        player.laid_points += _POINTS_BY_ID[card_identifier]
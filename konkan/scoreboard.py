@@ -44,26 +44,29 @@ class MatchHistory:
     def __post_init__(self) -> None:
         if self.num_players <= 0:
             raise ValueError("num_players must be positive")
-        self._wins = [0 for _ in range(self.num_players)]
-        self._laid = [0 for _ in range(self.num_players)]
-        self._deadwood = [0 for _ in range(self.num_players)]
-        self._net = [0 for _ in range(self.num_players)]
+        self._wins = [0] * self.num_players
+        self._laid = [0] * self.num_players
+        self._deadwood = [0] * self.num_players
+        self._net = [0] * self.num_players
 
     def record(self, summary: RoundSummary) -> None:
         """Record ``summary`` and update cumulative totals."""
 
         if len(summary.scores) != self.num_players:
             raise ValueError("score count does not match number of players")
+        num_players = self.num_players
+        for score in summary.scores:
+            if not 0 <= score.player_index < num_players:
+                raise ValueError("player index out of range")
         self.rounds.append(summary)
+        wins, laid, deadwood, net = self._wins, self._laid, self._deadwood, self._net
         for score in summary.scores:
             idx = score.player_index
-            if idx < 0 or idx >= self.num_players:
-                raise ValueError("player index out of range")
-            self._laid[idx] += score.laid_points
-            self._deadwood[idx] += score.deadwood_points
-            self._net[idx] += score.net_points
+            laid[idx] += score.laid_points
+            deadwood[idx] += score.deadwood_points
+            net[idx] += score.net_points
             if score.won_round:
-                self._wins[idx] += 1
+                wins[idx] += 1
 
     def totals(self) -> list[PlayerMatchTotal]:
         """Return the cumulative totals for each player in seating order."""
@@ -71,10 +74,12 @@ class MatchHistory:
         return [
             PlayerMatchTotal(
                 player_index=idx,
-                wins=self._wins[idx],
-                laid_points=self._laid[idx],
-                deadwood_points=self._deadwood[idx],
-                net_points=self._net[idx],
+                wins=wins,
+                laid_points=laid,
+                deadwood_points=deadwood,
+                net_points=net,
+            )
+            for idx, (wins, laid, deadwood, net) in enumerate(
+                zip(self._wins, self._laid, self._deadwood, self._net)
             )
-            for idx in range(self.num_players)
         ]
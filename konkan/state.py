@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import TYPE_CHECKING, Iterable, List, Sequence
 
 from . import encoding
@@ -19,6 +20,13 @@ else:  # pragma: no cover - runtime fallback when numpy is absent
     UInt16Array = object
     RulesTurnPhase = object
 
+# Shared read-only placeholder for the legacy ``deck``/``hands`` arrays.
+_EMPTY_U16: UInt16Array = np.zeros(0, dtype=np.uint16)
+if hasattr(_EMPTY_U16, "setflags"):  # the numpy-free fallback has no flags
+    _EMPTY_U16.setflags(write=False)
+# Single-bit mask for each card identifier, indexed by id.
+_CARD_BITS: tuple[int, ...] = tuple(1 << card_id for card_id in range(encoding.DECK_CARD_COUNT))
+
 
 class TurnPhase(str, Enum):
     """Phases that track high-level player actions."""
@@ -53,14 +61,15 @@ class PlayerState:
     def copy(self) -> "PlayerState":
         """Return a shallow copy of the player state."""
 
-        return PlayerState(
-            hand_mask=self.hand_mask,
-            laid_mask=self.laid_mask,
-            laid_points=self.laid_points,
-            has_come_down=self.has_come_down,
-            phase=self.phase,
-            last_action_was_trash=self.last_action_was_trash,
-        )
+        # Bypass ``__init__``; copies are made for every player on every clone.
+        clone = object.__new__(PlayerState)
+        clone.hand_mask = self.hand_mask
+        clone.laid_mask = self.laid_mask
+        clone.laid_points = self.laid_points
+        clone.has_come_down = self.has_come_down
+        clone.phase = self.phase
+        clone.last_action_was_trash = self.last_action_was_trash
+        return clone
 
 @dataclass(slots=True)
 class PublicState:
@@ -78,18 +87,19 @@ class PublicState:
     def copy(self) -> "PublicState":
         """Return a shallow copy of the public table state."""
 
-        return PublicState(
-            draw_pile=list(self.draw_pile),
-            trash_pile=list(self.trash_pile),
-            turn_index=self.turn_index,
-            dealer_index=self.dealer_index,
-            current_player_index=self.current_player_index,
-            winner_index=self.winner_index,
-            highest_table_points=self.highest_table_points,
-            last_trash_by=self.last_trash_by,
-        )
+        clone = object.__new__(PublicState)
+        clone.draw_pile = list(self.draw_pile)
+        clone.trash_pile = list(self.trash_pile)
+        clone.turn_index = self.turn_index
+        clone.dealer_index = self.dealer_index
+        clone.current_player_index = self.current_player_index
+        clone.winner_index = self.winner_index
+        clone.highest_table_points = self.highest_table_points
+        clone.last_trash_by = self.last_trash_by
+        return clone
 
 
+@lru_cache(maxsize=None)
 def _default_phase() -> "RulesTurnPhase":
     """Return the default turn phase for a fresh game state."""
 
@@ -98,18 +108,27 @@ def _default_phase() -> "RulesTurnPhase":
     return _TurnPhase.DRAW
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class MeldOnTable:
-    """Representation of a meld that is visible on the table."""
+    """Representation of a meld that is visible on the table.
+
+    Melds are immutable so cloned states can share them; rules code replaces
+    the table entry when a meld changes.
+    """
 
     mask_hi: int
     mask_lo: int
-    cards: List[int]
+    cards: tuple[int, ...]
     owner: int
     kind: int
     has_joker: bool
     points: int
     is_four_set: bool
+    mask128: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "cards", tuple(self.cards))
+        object.__setattr__(self, "mask128", (self.mask_hi << 64) | self.mask_lo)
 
 
 @dataclass(slots=True)
@@ -126,7 +145,7 @@ class KonkanState:
 
     player_to_act: int = 0
     turn_index: int = 0
-    deck: UInt16Array = field(default_factory=lambda: np.zeros(0, dtype=np.uint16))
+    deck: UInt16Array = field(default_factory=lambda: _EMPTY_U16)
     deck_top: int = 0
     trash: List[int] = field(default_factory=list)
     hands: List[UInt16Array] = field(default_factory=list)
@@ -135,40 +154,28 @@ class KonkanState:
     highest_table_points: int = 0
     first_player_has_discarded: bool = False
     phase: "RulesTurnPhase" = field(default_factory=_default_phase)
-    config: KonkanConfig | None = None
+    config: KonkanConfig | None = field(default=None, repr=False, compare=False)
     players: List[PlayerState] = field(default_factory=list)
 
     def clone_shallow(self) -> "KonkanState":
         """Create a shallow copy of the state suitable for branching search."""
 
-        public_copy = self.public.copy()
-        return KonkanState(
-            player_to_act=self.player_to_act,
-            turn_index=self.turn_index,
-            deck=self.deck.copy(),
-            deck_top=self.deck_top,
-            trash=list(self.trash),
-            hands=[hand.copy() for hand in self.hands],
-            table=[
-                MeldOnTable(
-                    mask_hi=meld.mask_hi,
-                    mask_lo=meld.mask_lo,
-                    cards=list(meld.cards),
-                    owner=meld.owner,
-                    kind=meld.kind,
-                    has_joker=meld.has_joker,
-                    points=meld.points,
-                    is_four_set=meld.is_four_set,
-                )
-                for meld in self.table
-            ],
-            public=public_copy,
-            highest_table_points=self.highest_table_points,
-            first_player_has_discarded=self.first_player_has_discarded,
-            phase=self.phase,
-            config=self.config,
-            players=[player.copy() for player in self.players],
-        )
+        # Bypass ``__init__`` and its default factories; every field is set below.
+        clone = object.__new__(KonkanState)
+        clone.player_to_act = self.player_to_act
+        clone.turn_index = self.turn_index
+        clone.deck = self.deck if self.deck is _EMPTY_U16 else self.deck.copy()
+        clone.deck_top = self.deck_top
+        clone.trash = list(self.trash)
+        clone.hands = [hand if hand is _EMPTY_U16 else hand.copy() for hand in self.hands]
+        clone.table = list(self.table)
+        clone.public = self.public.copy()
+        clone.highest_table_points = self.highest_table_points
+        clone.first_player_has_discarded = self.first_player_has_discarded
+        clone.phase = self.phase
+        clone.config = self.config
+        clone.players = [player.copy() for player in self.players]
+        return clone
 
     def register_discard(self, player_index: int) -> None:
         """Update bookkeeping after a player discards a card."""
@@ -181,20 +188,30 @@ class KonkanState:
 def hand_mask(hand: Iterable[int]) -> tuple[int, int]:
     """Compute the (hi, lo) bitset mask for a player's hand."""
 
-    mask_hi = 0
-    mask_lo = 0
-    for card_identifier in hand:
-        if card_identifier < 64:
-            mask_lo |= 1 << card_identifier
-        else:
-            mask_hi |= 1 << (card_identifier - 64)
-    return mask_hi, mask_lo
+    # Convert NumPy hands to Python ints in one call; shifting ``uint16``
+    # scalars would overflow and element-wise iteration boxes every card.
+    cards = hand.tolist() if hasattr(hand, "tolist") else list(hand)
+    return encoding.split_mask(_cards_mask(cards))
+
+
+def _cards_mask(cards: Sequence[int]) -> int:
+    """OR together table bits for ``cards``, rejecting out-of-range identifiers."""
+
+    # Range-check once up front; a bare table lookup would map -1 onto a joker.
+    if cards and (min(cards) < 0 or max(cards) >= encoding.DECK_CARD_COUNT):
+        bad = next(card for card in cards if card < 0 or card >= encoding.DECK_CARD_COUNT)
+        raise ValueError(f"card identifier {bad} out of range")
+    mask = 0
+    card_bits = _CARD_BITS
+    for card_identifier in cards:
+        mask |= card_bits[card_identifier]
+    return mask
 
 
 def new_game_state(num_players: int) -> KonkanState:
     """Return an empty shell game state with the requested player count."""
 
-    hands = [np.zeros(0, dtype=np.uint16) for _ in range(num_players)]
+    hands = [_EMPTY_U16] * num_players
     public = PublicState(
         draw_pile=[],
         trash_pile=[],
@@ -205,7 +222,7 @@ def new_game_state(num_players: int) -> KonkanState:
     return KonkanState(
         player_to_act=0,
         turn_index=0,
-        deck=np.zeros(0, dtype=np.uint16),
+        deck=_EMPTY_U16,
         deck_top=0,
         trash=[],
         hands=hands,
@@ -226,17 +243,20 @@ def deal_new_game(config: KonkanConfig, deck_cards: Sequence[int]) -> KonkanStat
     if config.num_players:
         first_player_index = (config.dealer_index + 1) % config.num_players
 
-    for idx, player in enumerate(players):
-        desired_cards = config.hand_size
-        if idx == first_player_index and config.first_player_hand_size is not None:
-            desired_cards = config.first_player_hand_size
-        elif idx == first_player_index and config.first_player_hand_size is None:
-            desired_cards = config.hand_size
-        for _ in range(desired_cards):
-            if not draw_pile:
-                raise ValueError("insufficient cards in deck for requested hand size")
-            card_identifier = draw_pile.pop()
-            player.hand_mask = encoding.add_card(player.hand_mask, card_identifier)
+    hand_sizes = [config.hand_size] * config.num_players
+    if config.num_players and config.first_player_hand_size is not None:
+        hand_sizes[first_player_index] = config.first_player_hand_size
+    dealt_count = sum(hand_sizes)
+    if dealt_count > len(draw_pile):
+        raise ValueError("insufficient cards in deck for requested hand size")
+
+    # Each hand is dealt from the top (end) of the pile as one slice.
+    for player, desired_cards in zip(players, hand_sizes):
+        if desired_cards <= 0:
+            continue
+        split_index = len(draw_pile) - desired_cards
+        player.hand_mask = _cards_mask(draw_pile[split_index:])
+        del draw_pile[split_index:]
 
     current_player = first_player_index if config.num_players else 0
     public = PublicState(
@@ -250,7 +270,7 @@ def deal_new_game(config: KonkanConfig, deck_cards: Sequence[int]) -> KonkanStat
     return KonkanState(
         player_to_act=current_player,
         turn_index=0,
-        deck=np.zeros(0, dtype=np.uint16),
+        deck=_EMPTY_U16,
         deck_top=0,
         trash=[],
         hands=[],
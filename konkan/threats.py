@@ -16,15 +16,20 @@ def _next_player_index(state: KonkanState, actor_index: int) -> int:
 def card_enables_sarf(state: KonkanState, player_index: int, card_id: int) -> bool:
     """Return True if ``player_index`` could sarf ``card_id`` immediately."""
 
-    if player_index < 0 or player_index >= len(state.players):
-        return False
+    # Most early-round states have no table; test that before the seat.
     if not state.table:
         return False
+    players = state.players
+    if player_index < 0 or player_index >= len(players):
+        return False
+    if not players[player_index].has_come_down:
+        return False
+    # Cheap superset test first; most discards cannot touch any meld.
+    if not (rules.table_extension_mask(state.table) >> card_id) & 1:
+        return False
 
     clone = state.clone_shallow()
     clone_player = clone.players[player_index]
-    if not clone_player.has_come_down:
-        return False
     if not encoding.has_card(clone_player.hand_mask, card_id):
         clone_player.hand_mask = encoding.add_card(clone_player.hand_mask, card_id)
 
@@ -37,7 +42,5 @@ def card_enables_sarf(state: KonkanState, player_index: int, card_id: int) -> bo
 def discard_feeds_next_player_sarf(state: KonkanState, actor_index: int, card_id: int) -> bool:
     """Return True when discarding ``card_id`` feeds the next player's sarf."""
 
-    if not state.players:
-        return False
-    next_index = _next_player_index(state, actor_index)
-    return card_enables_sarf(state, next_index, card_id)
+    # An empty player list falls through card_enables_sarf's seat check.
+    return card_enables_sarf(state, _next_player_index(state, actor_index), card_id)
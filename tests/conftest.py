@@ -4,7 +4,21 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
+from typing import Iterator
+
+import pytest
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(autouse=True)
+def _clear_rules_caches() -> Iterator[None]:
+    """Keep memoized solver results from leaking across monkeypatched tests."""
+
+    from konkan import rules
+
+    rules.clear_caches()
+    yield
+    rules.clear_caches()
@@ -3,9 +3,10 @@ from __future__ import annotations
 import pytest
 
 from konkan import actions, encoding, rules, state
-from konkan._compat import np
 from konkan.state import KonkanState
 
+_STOCK = (10, 11, 12)
+
 
 def _make_state_for_draw(
     trash_cards: list[int],
@@ -21,7 +22,7 @@ def _make_state_for_draw(
         come_down_points=come_down_points,
     )
     public = state.PublicState(
-        draw_pile=[10, 11, 12],
+        draw_pile=list(_STOCK),
         trash_pile=trash_cards,
         turn_index=turn_index,
         dealer_index=0,
@@ -32,7 +33,6 @@ def _make_state_for_draw(
     game_state = state.KonkanState(
         player_to_act=0,
         turn_index=turn_index,
-        deck=np.zeros(0, dtype=np.uint16),
         deck_top=0,
         trash=trash_cards.copy(),
         hands=[],
@@ -57,7 +57,7 @@ def _make_state_for_discard(
         come_down_points=come_down_points,
     )
     public = state.PublicState(
-        draw_pile=[10, 11, 12],
+        draw_pile=list(_STOCK),
         trash_pile=[20],
         turn_index=1,
         dealer_index=0,
@@ -69,7 +69,6 @@ def _make_state_for_discard(
     game_state = state.KonkanState(
         player_to_act=0,
         turn_index=1,
-        deck=np.zeros(0, dtype=np.uint16),
         deck_top=0,
         trash=[20],
         hands=[],
@@ -231,7 +230,6 @@ def test_rank_discard_avoids_feeding_next_player_sarf() -> None:
     game_state = state.KonkanState(
         player_to_act=0,
         turn_index=3,
-        deck=np.zeros(0, dtype=np.uint16),
         deck_top=0,
         trash=[],
         hands=[],
@@ -284,7 +282,6 @@ def test_rank_discard_prefers_isolated_high_cards_over_run_links() -> None:
     game_state = state.KonkanState(
         player_to_act=0,
         turn_index=1,
-        deck=np.zeros(0, dtype=np.uint16),
         deck_top=0,
         trash=[],
         hands=[],
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from konkan import encoding, rules, state
-from konkan._compat import np
 from konkan.demand import estimate_card_demand
 
 
@@ -25,7 +24,6 @@ def _three_player_state(hand_cards: list[int], opponent_cards: list[int], table_
     game_state = state.KonkanState(
         player_to_act=0,
         turn_index=12,
-        deck=np.zeros(0, dtype=np.uint16),
         deck_top=0,
         trash=[],
         hands=[],
@@ -3,7 +3,7 @@ from __future__ import annotations
 import random
 from typing import List
 
-from konkan import encoding, state
+from konkan import state
 from konkan.determinize import sample_world
 from konkan.state import PublicState
 
@@ -28,28 +28,26 @@ def test_sample_world_preserves_actor_hand_and_reassigns_opponents() -> None:
 
     original_draw = list(public.draw_pile)
     actor = public.current_player_index
-    original_actor_hand = encoding.cards_from_mask(game_state.players[actor].hand_mask)
+    original_actor_mask = game_state.players[actor].hand_mask
 
     determinized = sample_world(game_state, ReverseShuffle())
 
-    determinized_actor_hand = encoding.cards_from_mask(determinized.players[actor].hand_mask)
-    assert determinized_actor_hand == original_actor_hand
+    assert determinized.players[actor].hand_mask == original_actor_mask
 
     determinized_public = determinized.public
     assert isinstance(determinized_public, PublicState)
 
     assert determinized_public.draw_pile == list(reversed(original_draw))
 
-    seen_cards = set()
+    seen_mask = 0
     for idx, player in enumerate(determinized.players):
-        hand_cards = encoding.cards_from_mask(player.hand_mask)
         if idx == actor:
             continue
-        assert len(hand_cards) == 3
-        for cid in hand_cards:
-            assert cid not in original_actor_hand
-            assert cid not in seen_cards
-            seen_cards.add(cid)
+        hand = player.hand_mask
+        assert hand.bit_count() == 3
+        assert not hand & original_actor_mask
+        assert not hand & seen_mask
+        seen_mask |= hand
 
 
 def test_sample_world_uses_rng_shuffle() -> None:
@@ -3,7 +3,6 @@ from __future__ import annotations
 import pytest
 
 from konkan import encoding, rules, state
-from konkan._compat import np
 
 
 def test_come_down_threshold_and_laydown() -> None:
@@ -76,7 +75,6 @@ def test_final_scores_reflect_deadwood() -> None:
     game_state = state.KonkanState(
         player_to_act=0,
         turn_index=5,
-        deck=np.zeros(0, dtype=np.uint16),
         deck_top=0,
         trash=[],
         hands=[],
@@ -113,7 +111,6 @@ def test_final_scores_requires_winner() -> None:
     game_state = state.KonkanState(
         player_to_act=0,
         turn_index=0,
-        deck=np.zeros(0, dtype=np.uint16),
         deck_top=0,
         trash=[],
         hands=[],
@@ -1,9 +1,24 @@
 from __future__ import annotations
 
 from konkan import encoding, rules, state
-from konkan._compat import np
 from konkan.evaluation import analyze_hand
 
+_FIVE_CLUB_A = encoding.encode_standard_card(0, 4, 0)
+_FIVE_CLUB_B = encoding.encode_standard_card(0, 4, 1)
+_SIX_CLUB = encoding.encode_standard_card(0, 5, 0)
+_QUEEN_DIAMOND = encoding.encode_standard_card(2, 10, 0)
+
+_SEVEN_SPADE = encoding.encode_standard_card(0, 6, 0)
+_EIGHT_SPADE = encoding.encode_standard_card(0, 7, 0)
+_NINE_SPADE = encoding.encode_standard_card(0, 8, 0)
+_TEN_SPADE = encoding.encode_standard_card(0, 9, 0)
+_SPADE_RUN = (_SEVEN_SPADE, _EIGHT_SPADE, _NINE_SPADE)
+_SPADE_RUN_MASK = encoding.mask_from_cards(_SPADE_RUN)
+_SPADE_RUN_HI, _SPADE_RUN_LO = encoding.split_mask(_SPADE_RUN_MASK)
+_SPADE_RUN_POINTS = encoding.points_from_mask(_SPADE_RUN_MASK)
+
+_LATE_TRASH = tuple(range(10))
+
 
 def _state_with_hand(hand_cards: list[int]) -> state.KonkanState:
     config = state.KonkanConfig(num_players=1, dealer_index=0, hand_size=len(hand_cards))
@@ -19,7 +34,6 @@ def _state_with_hand(hand_cards: list[int]) -> state.KonkanState:
     return state.KonkanState(
         player_to_act=0,
         turn_index=1,
-        deck=np.zeros(0, dtype=np.uint16),
         deck_top=0,
         trash=[],
         hands=[],
@@ -34,16 +48,11 @@ def _state_with_hand(hand_cards: list[int]) -> state.KonkanState:
 
 
 def test_analyze_hand_rewards_consecutive_suit_links() -> None:
-    five_club_a = encoding.encode_standard_card(0, 4, 0)
-    five_club_b = encoding.encode_standard_card(0, 4, 1)
-    six_club = encoding.encode_standard_card(0, 5, 0)
-    queen_diamond = encoding.encode_standard_card(2, 10, 0)
-
-    game_state = _state_with_hand([five_club_a, five_club_b, six_club, queen_diamond])
+    game_state = _state_with_hand([_FIVE_CLUB_A, _FIVE_CLUB_B, _SIX_CLUB, _QUEEN_DIAMOND])
 
     metrics = analyze_hand(game_state, 0, demand_samples=4)
 
-    assert metrics[six_club].keep_value() > metrics[queen_diamond].keep_value()
+    assert metrics[_SIX_CLUB].keep_value() > metrics[_QUEEN_DIAMOND].keep_value()
 
 
 def test_keep_value_penalises_high_cards_late() -> None:
@@ -53,7 +62,7 @@ def test_keep_value_penalises_high_cards_late() -> None:
     early_state = _state_with_hand([high_card, low_card])
     late_state = _state_with_hand([high_card, low_card])
     late_state.public.turn_index = 40
-    late_state.public.trash_pile = list(range(10))
+    late_state.public.trash_pile = list(_LATE_TRASH)
 
     early_metrics = analyze_hand(early_state, 0)
     late_metrics = analyze_hand(late_state, 0)
@@ -63,11 +72,6 @@ def test_keep_value_penalises_high_cards_late() -> None:
 
 
 def test_metrics_capture_opponent_sarf_demand() -> None:
-    seven_spade = encoding.encode_standard_card(0, 6, 0)
-    eight_spade = encoding.encode_standard_card(0, 7, 0)
-    nine_spade = encoding.encode_standard_card(0, 8, 0)
-    ten_spade = encoding.encode_standard_card(0, 9, 0)
-
     config = state.KonkanConfig(num_players=2, dealer_index=0, hand_size=2, come_down_points=81)
     public = state.PublicState(
         draw_pile=[],
@@ -76,36 +80,32 @@ def test_metrics_capture_opponent_sarf_demand() -> None:
         dealer_index=0,
         current_player_index=0,
     )
-    player0 = state.PlayerState(hand_mask=encoding.mask_from_cards([ten_spade, encoding.encode_standard_card(1, 3, 0)]))
+    player0 = state.PlayerState(hand_mask=encoding.mask_from_cards([_TEN_SPADE, encoding.encode_standard_card(1, 3, 0)]))
     player0.phase = state.TurnPhase.AWAITING_TRASH
     player1 = state.PlayerState()
     player1.has_come_down = True
     player1.phase = state.TurnPhase.AWAITING_DRAW
 
-    meld_mask = encoding.mask_from_cards([seven_spade, eight_spade, nine_spade])
-    mask_hi, mask_lo = encoding.split_mask(meld_mask)
-    points = encoding.points_from_mask(meld_mask)
     meld = state.MeldOnTable(
-        mask_hi=mask_hi,
-        mask_lo=mask_lo,
-        cards=[seven_spade, eight_spade, nine_spade],
+        mask_hi=_SPADE_RUN_HI,
+        mask_lo=_SPADE_RUN_LO,
+        cards=_SPADE_RUN,
         owner=1,
         kind=1,
         has_joker=False,
-        points=points,
+        points=_SPADE_RUN_POINTS,
         is_four_set=False,
     )
 
     game_state = state.KonkanState(
         player_to_act=0,
         turn_index=12,
-        deck=np.zeros(0, dtype=np.uint16),
         deck_top=0,
         trash=[],
         hands=[],
         table=[meld],
         public=public,
-        highest_table_points=points,
+        highest_table_points=_SPADE_RUN_POINTS,
         first_player_has_discarded=True,
         phase=rules.TurnPhase.PLAY,
         config=config,
@@ -113,7 +113,7 @@ def test_metrics_capture_opponent_sarf_demand() -> None:
     )
 
     metrics = analyze_hand(game_state, 0, demand_samples=4)
-    demand = metrics[ten_spade].opponent_demand
+    demand = metrics[_TEN_SPADE].opponent_demand
 
     assert demand.sarf_risk > 0.5
 
@@ -138,7 +138,6 @@ def test_metrics_capture_come_down_risk() -> None:
     game_state = state.KonkanState(
         player_to_act=0,
         turn_index=6,
-        deck=np.zeros(0, dtype=np.uint16),
         deck_top=0,
         trash=[],
         hands=[],
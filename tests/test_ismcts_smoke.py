@@ -7,7 +7,7 @@ from konkan import actions, encoding, state
 from konkan.ismcts.search import SearchConfig, run_search
 
 
-def _simulate_game(seed: int) -> tuple[int | None, int]:
+def _simulate_game(seed: int, max_turns: int = 60) -> tuple[int | None, list[int]]:
     rng = random.Random(seed)
     config = state.KonkanConfig(
         num_players=3,
@@ -21,8 +21,8 @@ def _simulate_game(seed: int) -> tuple[int | None, int]:
     game_state = state.deal_new_game(config, deck)
     search_config = SearchConfig(simulations=32)
 
-    turns = 0
-    while turns < 60:
+    discards: list[int] = []
+    while len(discards) < max_turns:
         public = game_state.public
         if not isinstance(public, state.PublicState):
             break
@@ -60,19 +60,20 @@ def _simulate_game(seed: int) -> tuple[int | None, int]:
             play_options[0],
         )
         actions.apply_play_action(game_state, current, selected_action)
-        turns += 1
+        discards.append(selected_action.discard)
 
     public = game_state.public
     winner = None
     if isinstance(public, state.PublicState):
         winner = public.winner_index
-    return winner, turns
+    return winner, discards
 
 
 def test_mcts_simulation_is_deterministic() -> None:
-    winner_one, turns_one = _simulate_game(123)
-    winner_two, turns_two = _simulate_game(123)
+    _, discards_full = _simulate_game(123)
+    # Replaying a prefix with the same seed is enough to catch divergence;
+    # the full game only needs to run once.
+    _, discards_prefix = _simulate_game(123, max_turns=5)
 
-    assert winner_one == winner_two
-    assert turns_one == turns_two
-    assert turns_one > 0
+    assert discards_full
+    assert discards_prefix == discards_full[:5]
@@ -14,18 +14,17 @@ from konkan.melds import (
 
 pytestmark = pytest.mark.skipif(not HAVE_NATIVE_SOLVER, reason="Rust meld solver not available")
 
+# Run: hearts A-2-3, Set: three 7s, all in copy 0
+_HEART_RUN = tuple(encoding.encode_standard_card(1, rank, 0) for rank in (0, 1, 2))
+_SEVEN_SET = tuple(encoding.encode_standard_card(suit, 5, 0) for suit in (0, 1, 2))
+# Two 5-card runs plus a set of four distinct suits (total 14 cards)
+_SPADE_RUN = tuple(encoding.encode_standard_card(0, rank, 0) for rank in range(0, 5))  # A-5
+_HEART_HIGH_RUN = tuple(encoding.encode_standard_card(1, rank, 0) for rank in range(5, 10))  # 6-10
+_KING_SET = tuple(encoding.encode_standard_card(suit, 12, 0) for suit in range(4))  # Kings
+
 
 def _cards_from_meld(mask_hi: int, mask_lo: int) -> set[int]:
-    cards: set[int] = set()
-    for cid in range(106):
-        if cid < 64:
-            if (mask_lo >> cid) & 1:
-                cards.add(cid)
-        else:
-            bit = cid - 64
-            if (mask_hi >> bit) & 1:
-                cards.add(cid)
-    return cards
+    return set(encoding.cards_from_mask((mask_hi << 64) | mask_lo))
 
 
 def _mask_from_cards(cards: Iterable[int]) -> tuple[int, int]:
@@ -34,19 +33,12 @@ def _mask_from_cards(cards: Iterable[int]) -> tuple[int, int]:
 
 
 def test_enumerate_melds_detects_runs_and_sets() -> None:
-    # Run: hearts A-2-3, Set: three 7s, all in copy 0
-    run_cards = [
-        encoding.encode_standard_card(1, 0, 0),
-        encoding.encode_standard_card(1, 1, 0),
-        encoding.encode_standard_card(1, 2, 0),
-    ]
-    set_cards = [encoding.encode_standard_card(suit, 5, 0) for suit in (0, 1, 2)]
-    mask_hi, mask_lo = _mask_from_cards(run_cards + set_cards)
+    mask_hi, mask_lo = _mask_from_cards(_HEART_RUN + _SEVEN_SET)
     melds = enumerate_melds(mask_hi, mask_lo)
     meld_sets = [_cards_from_meld(m.mask_hi, m.mask_lo) for m in melds]
 
-    assert set(run_cards) in meld_sets
-    assert set(set_cards) in meld_sets
+    assert set(_HEART_RUN) in meld_sets
+    assert set(_SEVEN_SET) in meld_sets
 
 
 def test_best_cover_uses_joker_to_reach_threshold() -> None:
@@ -62,11 +54,7 @@ def test_best_cover_uses_joker_to_reach_threshold() -> None:
 
 
 def test_best_cover_for_go_out_covers_fourteen_cards() -> None:
-    # Two 5-card runs plus a set of four distinct suits (total 14 cards)
-    run_spades = [encoding.encode_standard_card(0, rank, 0) for rank in range(0, 5)]  # A-5
-    run_hearts = [encoding.encode_standard_card(1, rank, 0) for rank in range(5, 10)]  # 6-10
-    set_kings = [encoding.encode_standard_card(suit, 12, 0) for suit in range(4)]  # Kings
-    mask_hi, mask_lo = _mask_from_cards(run_spades + run_hearts + set_kings)
+    mask_hi, mask_lo = _mask_from_cards(_SPADE_RUN + _HEART_HIGH_RUN + _KING_SET)
 
     cover = best_cover_for_go_out(mask_hi, mask_lo)
     assert cover.covered_cards >= 14
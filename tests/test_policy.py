@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from konkan import actions, encoding, rules, state
-from konkan._compat import np
 from konkan.ismcts import policy
 
 
@@ -30,7 +29,6 @@ def test_policy_prefers_discarding_deadwood() -> None:
     game_state = state.KonkanState(
         player_to_act=0,
         turn_index=0,
-        deck=np.zeros(0, dtype=np.uint16),
         deck_top=0,
         trash=[],
         hands=[],
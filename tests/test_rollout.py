@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 from konkan import encoding, rules, state
-from konkan._compat import np
 from konkan.ismcts import rollout
 
+_FOUR_CLUB = encoding.encode_standard_card(0, 3, 0)
+_FIVE_CLUB = encoding.encode_standard_card(0, 4, 0)
+_SIX_CLUB = encoding.encode_standard_card(0, 5, 0)
+_QUEEN_DIAMOND = encoding.encode_standard_card(2, 10, 0)
+_TEN_HEART = encoding.encode_standard_card(1, 9, 0)
+
 
 def _base_state_for_rollout(hand_cards: list[int], *, trash: list[int], draw_pile: list[int], come_down_points: int = 15) -> state.KonkanState:
     config = state.KonkanConfig(num_players=2, dealer_index=0, hand_size=len(hand_cards), come_down_points=come_down_points)
@@ -23,7 +28,6 @@ def _base_state_for_rollout(hand_cards: list[int], *, trash: list[int], draw_pil
     return state.KonkanState(
         player_to_act=0,
         turn_index=5,
-        deck=np.array(draw_pile, dtype=np.uint16),
         deck_top=0,
         trash=list(trash),
         hands=[],
@@ -38,15 +42,10 @@ def _base_state_for_rollout(hand_cards: list[int], *, trash: list[int], draw_pil
 
 
 def test_rollout_turn_draws_trash_to_complete_run() -> None:
-    four_club = encoding.encode_standard_card(0, 3, 0)
-    five_club = encoding.encode_standard_card(0, 4, 0)
-    six_club = encoding.encode_standard_card(0, 5, 0)
-    queen_diamond = encoding.encode_standard_card(2, 10, 0)
-
     game_state = _base_state_for_rollout(
-        [five_club, six_club, queen_diamond],
-        trash=[four_club],
-        draw_pile=[encoding.encode_standard_card(1, 9, 0)],
+        [_FIVE_CLUB, _SIX_CLUB, _QUEEN_DIAMOND],
+        trash=[_FOUR_CLUB],
+        draw_pile=[_TEN_HEART],
         come_down_points=15,
     )
 
@@ -54,19 +53,14 @@ def test_rollout_turn_draws_trash_to_complete_run() -> None:
     rollout._simulate_turn(clone, 0)
 
     assert clone.players[0].has_come_down
-    assert clone.public.trash_pile and clone.public.trash_pile[-1] == queen_diamond
+    assert clone.public.trash_pile and clone.public.trash_pile[-1] == _QUEEN_DIAMOND
 
 
 def test_simulate_seed_turns_advances_value_when_trash_card_is_strong() -> None:
-    four_club = encoding.encode_standard_card(0, 3, 0)
-    five_club = encoding.encode_standard_card(0, 4, 0)
-    six_club = encoding.encode_standard_card(0, 5, 0)
-    queen_diamond = encoding.encode_standard_card(2, 10, 0)
-
     game_state = _base_state_for_rollout(
-        [five_club, six_club, queen_diamond],
-        trash=[four_club],
-        draw_pile=[encoding.encode_standard_card(1, 9, 0)],
+        [_FIVE_CLUB, _SIX_CLUB, _QUEEN_DIAMOND],
+        trash=[_FOUR_CLUB],
+        draw_pile=[_TEN_HEART],
         come_down_points=15,
     )
 
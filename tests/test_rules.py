@@ -19,28 +19,16 @@ class DummyCover:
     used_jokers: int = 0
 
 
-@pytest.mark.parametrize(
-    ("player_index", "expected"),
-    [
-        (0, 15),
-        (1, 14),
-        (5, 14),
-    ],
-)
-def test_deal_pattern_hand_size(player_index: int, expected: int) -> None:
-    assert rules.DEFAULT_DEAL_PATTERN.hand_size_for(player_index) == expected
-
-
-@pytest.mark.parametrize(
-    ("highest_table_points", "expected"),
-    [
-        (0, 81),
-        (81, 82),
-        (150, 151),
-    ],
-)
-def test_thresholds_next_value(highest_table_points: int, expected: int) -> None:
-    assert rules.DEFAULT_THRESHOLDS.next_for(highest_table_points) == expected
+def test_deal_pattern_hand_size() -> None:
+    for player_index, expected in ((0, 15), (1, 14), (5, 14)):
+        actual = rules.DEFAULT_DEAL_PATTERN.hand_size_for(player_index)
+        assert actual == expected, (player_index, expected)
+
+
+def test_thresholds_next_value() -> None:
+    for highest_table_points, expected in ((0, 81), (81, 82), (150, 151)):
+        actual = rules.DEFAULT_THRESHOLDS.next_for(highest_table_points)
+        assert actual == expected, (highest_table_points, expected)
 
 
 def test_effective_threshold_tracks_table_state() -> None:
@@ -104,15 +92,77 @@ def test_requires_opening_discard_flag() -> None:
     assert not rules.requires_opening_discard(state)
 
 
-@pytest.mark.parametrize(
-    ("hand_card_count", "came_down", "expected"),
-    [
+def test_can_finish_via_sarf() -> None:
+    cases = (
         (3, True, False),
         (2, True, True),
         (1, True, True),
         (2, False, False),
-    ],
-)
-def test_can_finish_via_sarf(hand_card_count: int, came_down: bool, expected: bool) -> None:
-    public = PlayerPublic(came_down=came_down, table_points=0)
-    assert rules.can_finish_via_sarf(hand_card_count, public) is expected
+    )
+    for hand_card_count, came_down, expected in cases:
+        public = PlayerPublic(came_down=came_down, table_points=0)
+        actual = rules.can_finish_via_sarf(hand_card_count, public)
+        assert actual is expected, (hand_card_count, came_down, expected)
+
+
+def test_can_draw_from_trash_rejects_hands_below_point_bound() -> None:
+    public = [PlayerPublic(False, 0) for _ in range(3)]
+    mask = hand_mask(np.array([0, 1, 2], dtype=np.uint16))
+    assert not rules.can_draw_from_trash(
+        trash=[10],
+        hand_mask=mask,
+        player_public=public[0],
+        public_state=public,
+        highest_table_points=0,
+    )
+
+
+@pytest.mark.parametrize("trash_card", [-1, 106])
+def test_can_draw_from_trash_rejects_out_of_range_trash_card(trash_card: int) -> None:
+    public = [PlayerPublic(False, 0) for _ in range(3)]
+    with pytest.raises(ValueError):
+        rules.can_draw_from_trash(
+            trash=[trash_card],
+            hand_mask=hand_mask(np.arange(20, dtype=np.uint16)),
+            player_public=public[0],
+            public_state=public,
+            highest_table_points=0,
+        )
+
+
+def test_clear_caches_applies_swapped_solver(monkeypatch: pytest.MonkeyPatch) -> None:
+    public = [PlayerPublic(False, 0) for _ in range(3)]
+    kwargs = dict(
+        trash=[20],
+        hand_mask=hand_mask(np.arange(20, dtype=np.uint16)),
+        player_public=public[0],
+        public_state=public,
+        highest_table_points=0,
+    )
+
+    monkeypatch.setattr(rules.melds, "best_cover_to_threshold", lambda _hi, _lo, _t: DummyCover(total_points=0))
+    rules.clear_caches()
+    assert not rules.can_draw_from_trash(**kwargs)
+
+    monkeypatch.setattr(rules.melds, "best_cover_to_threshold", lambda _hi, _lo, t: DummyCover(total_points=t))
+    rules.clear_caches()
+    assert rules.can_draw_from_trash(**kwargs)
+
+
+def test_can_draw_from_trash_uses_given_solver_verbatim() -> None:
+    public = [PlayerPublic(False, 0) for _ in range(3)]
+    calls: list[int] = []
+
+    def wrapped_cover(mask_hi: int, mask_lo: int, threshold: int) -> DummyCover:
+        calls.append(threshold)
+        return DummyCover(total_points=threshold)
+
+    assert rules.can_draw_from_trash(
+        trash=[10],
+        hand_mask=hand_mask([0, 1, 2]),
+        player_public=public[0],
+        public_state=public,
+        highest_table_points=0,
+        cover_to_threshold=wrapped_cover,
+    )
+    assert calls == [81]
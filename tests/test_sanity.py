@@ -4,21 +4,18 @@ from __future__ import annotations
 
 import importlib
 
-import pytest
+MODULES = (
+    "konkan",
+    "konkan.cards",
+    "konkan.encoding",
+    "konkan.state",
+    "konkan.melds",
+    "konkan.ismcts.search",
+)
 
 
-@pytest.mark.parametrize(
-    "module_name",
-    [
-        "konkan",
-        "konkan.cards",
-        "konkan.encoding",
-        "konkan.state",
-        "konkan.melds",
-        "konkan.ismcts.search",
-    ],
-)
-def test_modules_import(module_name: str) -> None:
+def test_modules_import() -> None:
     """Ensure all foundational modules can be imported."""
 
-    assert importlib.import_module(module_name)
+    for module_name in MODULES:
+        assert importlib.import_module(module_name), module_name
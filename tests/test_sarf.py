@@ -2,26 +2,31 @@ from __future__ import annotations
 
 from typing import List
 
-import numpy as np
+import pytest
 
 from konkan import encoding, rules, state
 
 SET_KIND = 0
 RUN_KIND = 1
 
+_LOW_SPADE_RUN = [encoding.encode_standard_card(0, rank, 0) for rank in (0, 1, 2)]
+_MID_SPADE_RUN = [encoding.encode_standard_card(0, rank, 0) for rank in (4, 5, 6)]
+_FOUR_SPADE = encoding.encode_standard_card(0, 3, 0)
+
 
 def _table_meld(cards: List[int], owner: int, kind: int) -> state.MeldOnTable:
     mask = encoding.mask_from_cards(cards)
     mask_hi, mask_lo = encoding.split_mask(mask)
+    has_joker = bool(mask & encoding.JOKER_MASK)
     return state.MeldOnTable(
         mask_hi=mask_hi,
         mask_lo=mask_lo,
         cards=list(cards),
         owner=owner,
         kind=kind,
-        has_joker=any(card in encoding.JOKER_IDS for card in cards),
+        has_joker=has_joker,
         points=encoding.points_from_mask(mask),
-        is_four_set=kind == SET_KIND and len(cards) == 4 and not any(card in encoding.JOKER_IDS for card in cards),
+        is_four_set=kind == SET_KIND and len(cards) == 4 and not has_joker,
     )
 
 
@@ -39,7 +44,6 @@ def _base_state(hand_cards: List[int], current_player: int = 0) -> state.KonkanS
     return state.KonkanState(
         player_to_act=current_player,
         turn_index=1,
-        deck=np.zeros(0, dtype=np.uint16),
         deck_top=0,
         trash=[],
         hands=[],
@@ -53,26 +57,21 @@ def _base_state(hand_cards: List[int], current_player: int = 0) -> state.KonkanS
     )
 
 
-def test_sarf_card_extends_run() -> None:
-    hand = [encoding.encode_standard_card(0, 3, 0)]
-    game_state = _base_state(hand)
-    game_state.table.append(
-        _table_meld(
-            [
-                encoding.encode_standard_card(0, 0, 0),
-                encoding.encode_standard_card(0, 1, 0),
-                encoding.encode_standard_card(0, 2, 0),
-            ],
-            owner=1,
-            kind=RUN_KIND,
-        )
-    )
+@pytest.mark.parametrize(
+    ("card_to_sarf", "run_cards"),
+    [
+        pytest.param(_FOUR_SPADE, _LOW_SPADE_RUN, id="next-rank"),
+        pytest.param(encoding.JOKER_IDS[0], _MID_SPADE_RUN, id="joker"),
+    ],
+)
+def test_sarf_card_extends_run(card_to_sarf: int, run_cards: List[int]) -> None:
+    game_state = _base_state([card_to_sarf])
+    game_state.table.append(_table_meld(run_cards, owner=1, kind=RUN_KIND))
 
-    card_to_sarf = hand[0]
     assert rules.can_sarf_card(game_state, 0, 0, card_to_sarf)
     rules.sarf_card(game_state, 0, 0, card_to_sarf)
 
-    assert card_to_sarf not in encoding.cards_from_mask(game_state.players[0].hand_mask)
+    assert not encoding.has_card(game_state.players[0].hand_mask, card_to_sarf)
     assert card_to_sarf in game_state.table[0].cards
     assert encoding.has_card(game_state.players[0].laid_mask, card_to_sarf)
     assert game_state.players[0].laid_points == encoding.card_points(card_to_sarf)
@@ -90,8 +89,7 @@ def test_sarf_card_swaps_joker() -> None:
 
     rules.sarf_card(game_state, 0, 0, seven_diamond)
 
-    player_hand = encoding.cards_from_mask(game_state.players[0].hand_mask)
-    assert joker in player_hand
+    assert encoding.has_card(game_state.players[0].hand_mask, joker)
     assert seven_diamond in game_state.table[0].cards
     assert encoding.has_card(game_state.players[0].laid_mask, seven_diamond)
     assert game_state.players[0].laid_points == encoding.card_points(seven_diamond)
@@ -100,48 +98,35 @@ def test_sarf_card_swaps_joker() -> None:
 def test_can_sarf_card_rejects_invalid() -> None:
     hand = [encoding.encode_standard_card(0, 10, 0)]
     game_state = _base_state(hand)
-    game_state.table.append(
-        _table_meld(
-            [
-                encoding.encode_standard_card(0, 0, 0),
-                encoding.encode_standard_card(0, 1, 0),
-                encoding.encode_standard_card(0, 2, 0),
-            ],
-            owner=1,
-            kind=RUN_KIND,
-        )
-    )
+    game_state.table.append(_table_meld(_LOW_SPADE_RUN, owner=1, kind=RUN_KIND))
 
     assert not rules.can_sarf_card(game_state, 0, 0, hand[0])
 
 
-def test_sarf_card_allows_joker_extension() -> None:
-    joker = encoding.JOKER_IDS[0]
-    hand = [joker]
-    game_state = _base_state(hand)
+def test_table_extension_mask_limits_runs_to_open_ends() -> None:
+    extension = rules.table_extension_mask([_table_meld(_MID_SPADE_RUN, owner=1, kind=RUN_KIND)])
 
-    run_cards = [
-        encoding.encode_standard_card(0, 4, 0),
-        encoding.encode_standard_card(0, 5, 0),
-        encoding.encode_standard_card(0, 6, 0),
-    ]
-    mask = encoding.mask_from_cards(run_cards)
-    mask_hi, mask_lo = encoding.split_mask(mask)
-    game_state.table.append(
-        state.MeldOnTable(
-            mask_hi=mask_hi,
-            mask_lo=mask_lo,
-            cards=list(run_cards),
-            owner=1,
-            kind=RUN_KIND,
-            has_joker=False,
-            points=encoding.points_from_mask(mask),
-            is_four_set=False,
-        )
-    )
+    assert encoding.has_card(extension, encoding.encode_standard_card(0, 3, 1))
+    assert encoding.has_card(extension, encoding.encode_standard_card(0, 7, 0))
+    assert encoding.has_card(extension, encoding.JOKER_IDS[0])
+    assert not encoding.has_card(extension, encoding.encode_standard_card(0, 9, 0))
+    assert not encoding.has_card(extension, encoding.encode_standard_card(1, 7, 0))
+
+
+def test_sarf_card_leaves_shared_meld_untouched() -> None:
+    run_cards = _MID_SPADE_RUN
+    extension = encoding.encode_standard_card(0, 7, 0)
+    game_state = _base_state([extension])
+    game_state.table.append(_table_meld(run_cards, owner=1, kind=RUN_KIND))
 
-    assert rules.can_sarf_card(game_state, 0, 0, joker)
-    rules.sarf_card(game_state, 0, 0, joker)
+    meld = game_state.table[0]
+    snapshot = game_state.clone_shallow()
+    assert rules.can_sarf_card(game_state, 0, 0, extension)
+    rules.sarf_card(game_state, 0, 0, extension)
 
-    assert joker not in encoding.cards_from_mask(game_state.players[0].hand_mask)
-    assert joker in game_state.table[0].cards
+    updated = game_state.table[0]
+    assert snapshot.table[0] is meld
+    assert meld.mask128 == encoding.mask_from_cards(run_cards)
+    assert updated.mask128 == encoding.mask_from_cards(run_cards + [extension])
+    assert updated.mask128 == (updated.mask_hi << 64) | updated.mask_lo
+    assert sorted(updated.cards) == sorted(run_cards + [extension])
@@ -62,3 +62,20 @@ def test_match_history_validates_player_count() -> None:
     )
     with pytest.raises(ValueError):
         history.record(summary)
+
+
+def test_match_history_rejects_bad_index_without_partial_update() -> None:
+    history = scoreboard.MatchHistory(num_players=2)
+    summary = scoreboard.RoundSummary(
+        round_number=1,
+        winner_index=0,
+        scores=[
+            _score(0, laid=50, deadwood=0, net=50, won=True),
+            _score(2, laid=10, deadwood=5, net=5, won=False),
+        ],
+    )
+    with pytest.raises(ValueError):
+        history.record(summary)
+
+    assert history.rounds == []
+    assert all(total.laid_points == 0 and total.wins == 0 for total in history.totals())
@@ -5,14 +5,17 @@ import random
 import pytest
 
 from konkan import encoding, rules, state
-from konkan._compat import np
 from konkan.ismcts import policy, rollout, search
 
+_ACE_SPADE = encoding.encode_standard_card(0, 0, 0)
+_ACE_HEART = encoding.encode_standard_card(1, 0, 0)
+_TWO_SPADE = encoding.encode_standard_card(0, 1, 0)
+_ACE_SPADE_MASK = encoding.mask_from_cards([_ACE_SPADE])
+_ACE_HEART_MASK = encoding.mask_from_cards([_ACE_HEART])
+_ACE_TWO_SPADE_MASK = encoding.mask_from_cards([_ACE_SPADE, _TWO_SPADE])
 
-def test_run_search_uses_ris_monkeypatch(monkeypatch) -> None:
-    card0 = encoding.encode_standard_card(0, 0, 0)
-    card1 = encoding.encode_standard_card(1, 0, 0)
 
+def test_run_search_uses_ris_monkeypatch(monkeypatch) -> None:
     config = state.KonkanConfig(num_players=2, hand_size=1)
     public = state.PublicState(
         draw_pile=[],
@@ -23,19 +26,18 @@ def test_run_search_uses_ris_monkeypatch(monkeypatch) -> None:
     )
 
     player0 = state.PlayerState(
-        hand_mask=encoding.mask_from_cards([card0]),
+        hand_mask=_ACE_SPADE_MASK,
         phase=state.TurnPhase.AWAITING_TRASH,
         has_come_down=True,
     )
     player1 = state.PlayerState(
-        hand_mask=encoding.mask_from_cards([card1]),
+        hand_mask=_ACE_HEART_MASK,
         phase=state.TurnPhase.AWAITING_DRAW,
     )
 
     game_state = state.KonkanState(
         player_to_act=0,
         turn_index=0,
-        deck=np.zeros(0, dtype=np.uint16),
         deck_top=0,
         trash=[],
         hands=[],
@@ -62,13 +64,10 @@ def test_run_search_uses_ris_monkeypatch(monkeypatch) -> None:
 
     assert calls
     assert calls[0] == 0
-    assert any(call == 1 for call in calls[1:])
+    assert 1 in calls[1:]
 
 
 def test_run_search_applies_dirichlet_noise(monkeypatch) -> None:
-    card0 = encoding.encode_standard_card(0, 0, 0)
-    card1 = encoding.encode_standard_card(0, 1, 0)
-
     config_obj = state.KonkanConfig(num_players=1, hand_size=2)
     public = state.PublicState(
         draw_pile=[],
@@ -79,7 +78,7 @@ def test_run_search_applies_dirichlet_noise(monkeypatch) -> None:
     )
 
     player = state.PlayerState(
-        hand_mask=encoding.mask_from_cards([card0, card1]),
+        hand_mask=_ACE_TWO_SPADE_MASK,
         phase=state.TurnPhase.AWAITING_TRASH,
         has_come_down=True,
     )
@@ -87,7 +86,6 @@ def test_run_search_applies_dirichlet_noise(monkeypatch) -> None:
     game_state = state.KonkanState(
         player_to_act=0,
         turn_index=0,
-        deck=np.zeros(0, dtype=np.uint16),
         deck_top=0,
         trash=[],
         hands=[],
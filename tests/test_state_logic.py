@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import dataclasses
 from typing import List
 
+import numpy as np
 import pytest
 
 from konkan import encoding, rules, state
@@ -22,7 +24,7 @@ def test_deal_new_game_assigns_hand_sizes() -> None:
     assert isinstance(game_state.public, state.PublicState)
 
     first_player = (config.dealer_index + 1) % config.num_players
-    hand_sizes = [len(encoding.cards_from_mask(player.hand_mask)) for player in game_state.players]
+    hand_sizes = [player.hand_mask.bit_count() for player in game_state.players]
 
     assert hand_sizes[first_player] == 15
     for idx, size in enumerate(hand_sizes):
@@ -63,7 +65,7 @@ def test_sample_world_shuffles_with_custom_rng() -> None:
 
     determinized = sample_world(game_state, ReverseShuffle())
 
-    assert determinized.public.draw_pile == list(reversed(original_draw))
+    assert determinized.public.draw_pile == original_draw[::-1]
     assert game_state.public.draw_pile == original_draw
 
 
@@ -81,3 +83,70 @@ def test_tools_run_test_sequence(monkeypatch: pytest.MonkeyPatch) -> None:
 
     assert exit_code == 0
     assert len(recorded) == 3
+
+
+def test_hand_mask_handles_uint16_arrays() -> None:
+    cards = [5, 40, 70, 105]
+    expected = encoding.split_mask(encoding.mask_from_cards(cards))
+
+    assert state.hand_mask(np.array(cards, dtype=np.uint16)) == expected
+    assert state.hand_mask(cards) == expected
+
+
+def test_points_from_mask_ignores_bits_outside_the_deck() -> None:
+    ace = encoding.encode_standard_card(0, 0, 0)
+
+    assert encoding.points_from_mask(1 << 120) == 0
+    assert encoding.points_from_mask(1 << 106) == 0
+    assert encoding.points_from_mask((1 << 120) | (1 << ace)) == encoding.card_points(ace)
+
+
+@pytest.mark.parametrize("card_identifier", [-1, 106])
+def test_hand_mask_rejects_out_of_range_cards(card_identifier: int) -> None:
+    with pytest.raises(ValueError):
+        state.hand_mask([5, card_identifier])
+
+
+def test_player_state_copy_is_independent() -> None:
+    original = state.PlayerState(hand_mask=0b1011, laid_mask=0b100, laid_points=7, has_come_down=True)
+    original.phase = state.TurnPhase.AWAITING_TRASH
+
+    clone = original.copy()
+    assert clone == original
+
+    clone.hand_mask = 0
+    assert original.hand_mask == 0b1011
+
+
+def test_default_deck_is_shared_read_only_sentinel() -> None:
+    first = state.KonkanState()
+    second = state.KonkanState()
+
+    assert first.deck is second.deck
+    assert first.deck.size == 0
+    with pytest.raises(ValueError):
+        first.deck[...] = 0
+    assert first.clone_shallow().deck is first.deck
+
+
+def test_clone_shallow_copies_every_field() -> None:
+    config = state.KonkanConfig(num_players=3)
+    original = state.deal_new_game(config, list(range(106)))
+
+    clone = original.clone_shallow()
+    for entry in dataclasses.fields(state.KonkanState):
+        if entry.name == "deck":
+            assert np.array_equal(clone.deck, original.deck)
+        else:
+            assert getattr(clone, entry.name) == getattr(original, entry.name)
+
+    clone.public.draw_pile.pop()
+    clone.players[0].hand_mask = 0
+    assert clone.public.draw_pile != original.public.draw_pile
+    assert original.players[0].hand_mask != 0
+
+
+def test_deal_new_game_rejects_out_of_range_cards() -> None:
+    config = state.KonkanConfig(num_players=2, hand_size=2, first_player_hand_size=2)
+    with pytest.raises(ValueError):
+        state.deal_new_game(config, [0, 1, 2, 200])
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 from konkan import encoding, rules, state
-from konkan._compat import np
 from konkan.threats import card_enables_sarf, discard_feeds_next_player_sarf
 
+_LOW_SPADE_RUN = [encoding.encode_standard_card(0, rank, 0) for rank in (2, 3, 4)]
+_HIGH_SPADE_RUN = [encoding.encode_standard_card(0, rank, 0) for rank in (6, 7, 8)]
+_SIX_SPADE = encoding.encode_standard_card(0, 5, 0)
+_TEN_SPADE = encoding.encode_standard_card(0, 9, 0)
+_EIGHT_HEART = encoding.encode_standard_card(1, 7, 0)
+
 
 def _state_with_table(meld_cards: list[int]) -> state.KonkanState:
     config = state.KonkanConfig(num_players=3, hand_size=3)
@@ -35,7 +40,6 @@ def _state_with_table(meld_cards: list[int]) -> state.KonkanState:
     return state.KonkanState(
         player_to_act=0,
         turn_index=10,
-        deck=np.zeros(0, dtype=np.uint16),
         deck_top=0,
         trash=[],
         hands=[],
@@ -50,38 +54,37 @@ def _state_with_table(meld_cards: list[int]) -> state.KonkanState:
 
 
 def test_card_enables_sarf_detects_extension() -> None:
-    ten_spade = encoding.encode_standard_card(0, 9, 0)
-    meld = [
-        encoding.encode_standard_card(0, 6, 0),
-        encoding.encode_standard_card(0, 7, 0),
-        encoding.encode_standard_card(0, 8, 0),
-    ]
-
-    game_state = _state_with_table(meld)
+    game_state = _state_with_table(_HIGH_SPADE_RUN)
 
-    assert card_enables_sarf(game_state, 1, ten_spade)
+    assert card_enables_sarf(game_state, 1, _TEN_SPADE)
 
 
 def test_discard_feeds_next_player_sarf_true_when_next_player_has_run() -> None:
-    ten_spade = encoding.encode_standard_card(0, 9, 0)
-    meld = [
-        encoding.encode_standard_card(0, 6, 0),
-        encoding.encode_standard_card(0, 7, 0),
-        encoding.encode_standard_card(0, 8, 0),
-    ]
-
-    game_state = _state_with_table(meld)
+    game_state = _state_with_table(_HIGH_SPADE_RUN)
 
-    assert discard_feeds_next_player_sarf(game_state, 0, ten_spade)
+    assert discard_feeds_next_player_sarf(game_state, 0, _TEN_SPADE)
 
 
 def test_discard_feeds_next_player_sarf_false_when_no_meld() -> None:
-    game_state = _state_with_table([
-        encoding.encode_standard_card(0, 2, 0),
-        encoding.encode_standard_card(0, 3, 0),
-        encoding.encode_standard_card(0, 4, 0),
-    ])
+    game_state = _state_with_table(_LOW_SPADE_RUN)
+
+    assert not discard_feeds_next_player_sarf(game_state, 0, _EIGHT_HEART)
+
+
+def test_card_enables_sarf_skips_solver_for_unrelated_cards(monkeypatch) -> None:
+    game_state = _state_with_table(_LOW_SPADE_RUN)
+
+    def fail_can_sarf(*_args: object) -> bool:
+        raise AssertionError("extension mask should reject the card first")
+
+    monkeypatch.setattr(rules, "can_sarf_card", fail_can_sarf)
+
+    assert not card_enables_sarf(game_state, 1, _EIGHT_HEART)
+    assert not card_enables_sarf(game_state, 1, _TEN_SPADE)
+
 
-    eight_heart = encoding.encode_standard_card(1, 7, 0)
+def test_discard_feeds_next_player_sarf_false_without_players() -> None:
+    game_state = _state_with_table(_LOW_SPADE_RUN)
+    game_state.players = []
 
-    assert not discard_feeds_next_player_sarf(game_state, 0, eight_heart)
+    assert not discard_feeds_next_player_sarf(game_state, 0, _SIX_SPADE)
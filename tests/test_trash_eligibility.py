@@ -4,20 +4,18 @@ import pytest
 
 from konkan import encoding, rules, state
 
+_card = encoding.encode_standard_card
+_FOUR_CARD_POPS = (_card(0, 0, 0), _card(0, 1, 0), _card(1, 0, 0), _card(1, 1, 0))
+_THREE_ACE_POPS = (_card(0, 0, 0), _card(1, 0, 0), _card(2, 0, 0))
+
 
 def make_sequence(sequence: list[int]) -> list[int]:
-    return list(reversed(sequence))
+    return sequence[::-1]
 
 
 def test_cannot_take_own_last_trash() -> None:
     config = state.KonkanConfig(num_players=1, hand_size=2, allow_trash_first_turn=True)
-    card = encoding.encode_standard_card
-    pop_sequence = [
-        card(0, 0, 0),
-        card(0, 1, 0),
-        card(1, 0, 0),
-        card(1, 1, 0),
-    ]
+    pop_sequence = list(_FOUR_CARD_POPS)
     deck = make_sequence(pop_sequence)
     game_state = state.deal_new_game(config, deck)
 
@@ -31,8 +29,7 @@ def test_cannot_take_own_last_trash() -> None:
 
 def test_first_turn_trash_blocked_when_disabled() -> None:
     config = state.KonkanConfig(num_players=2, hand_size=1, allow_trash_first_turn=False)
-    card = encoding.encode_standard_card
-    pop_sequence = [card(0, 0, 0), card(1, 0, 0), card(2, 0, 0)]
+    pop_sequence = list(_THREE_ACE_POPS)
     deck = make_sequence(pop_sequence)
     game_state = state.deal_new_game(config, deck)
 